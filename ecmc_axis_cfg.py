@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 import argparse
 import csv
-import json
 import re
 import subprocess
 import sys
@@ -16,6 +15,7 @@ from ecmc_stream_qt import (
     EpicsClient,
     _join_prefix_pv,
     _proc_pv_for_readback,
+    _read_json_file,
     compact_float_text,
     normalize_float_literals,
     query_value_indicates_error,
@@ -508,7 +508,7 @@ class AxisYamlConfigWindow(QtWidgets.QMainWindow):
         if not p.exists():
             return {}
         try:
-            data = json.loads(p.read_text())
+            data = _read_json_file(p)
         except Exception as ex:
             self._log(f"Failed to load error DB {p}: {ex}")
             return {}
@@ -532,7 +532,7 @@ class AxisYamlConfigWindow(QtWidgets.QMainWindow):
         if not p.exists():
             return {"commands": []}
         try:
-            return json.loads(p.read_text())
+            return _read_json_file(p)
         except Exception:
             return {"commands": []}
 
@@ -13,6 +13,7 @@ from ecmc_stream_qt import (
     EpicsClient,
     _join_prefix_pv,
     _proc_pv_for_readback,
+    _read_json_file,
     compact_float_text,
     load_local_error_name_map,
     normalize_float_literals,
@@ -346,7 +347,7 @@ class CntrlWindow(QtWidgets.QMainWindow):
         if not p.exists():
             return {'commands': []}
         try:
-            return json.loads(p.read_text())
+            return _read_json_file(p)
         except Exception:
             return {'commands': []}
 
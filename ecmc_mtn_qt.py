@@ -1,15 +1,22 @@
 #!/usr/bin/env python3
 import argparse
+import itertools
 import re
 import subprocess
 import sys
 import time
 from collections import deque
-from datetime import datetime
 
 from qt_compat import QtCore, QtGui, QtWidgets
 
-from ecmc_stream_qt import EpicsClient, _join_prefix_pv, compact_float_text
+from ecmc_stream_qt import CompactDoubleSpinBox, EpicsClient, _join_prefix_pv, compact_float_text
+
+Signal = getattr(QtCore, "pyqtSignal", None)
+if Signal is None:
+    Signal = getattr(QtCore, "Signal")
+Slot = getattr(QtCore, "pyqtSlot", None)
+if Slot is None:
+    Slot = getattr(QtCore, "Slot")
 
 APP_LAUNCH_PLACEHOLDER = "Open app..."
 APP_LAUNCH_MOTION = "New Motion App"
@@ -21,6 +28,58 @@ APP_LAUNCH_RTLOG = "ecmc Log App"
 APP_LAUNCH_CAQTDM_MAIN = "caqtdm Main"
 APP_LAUNCH_CAQTDM_AXIS = "caqtdm Axis"
 
+# Motor record fields/suffixes used by the polling and motion paths. Their PV
+# names are prebuilt whenever the motor record base changes.
+MOTOR_RECORD_CACHED_FIELDS = (
+    "VAL", "RBV", "RLV", "DMOV", "MOVN", "VELO", "ACCL", "ACCS", "VMAX", "JVEL",
+    "CNEN", "STOP", "SPMG", "JOGF", "JOGR", "TWV", "TWF", "TWR",
+)
+MOTOR_SUFFIX_CACHED_PVS = ("-ErrId", "-MsgTxt", "-PosAct", "-PosSet", "-PosErr")
+# A sequence move that never shows DMOV=0 (too short to catch) is taken as done
+# once DMOV=1 is still seen this long after the VAL put.
+SEQ_DMOV_GRACE_S = 1.0
+MOTOR_NAME_SUFFIX_FMTS = (
+    "MCU-Cfg-AX{ax}-Nam",
+    "MCU-Cfg-AX{ax}-Mtr",
+    "MCU-Cfg-AX{ax}-MtrName",
+    "MCU-Cfg-AX{ax}-Motor",
+    "MCU-Cfg-AX{ax}-MotorName",
+    "MCU-Cfg-AX{ax}-Pfx",  # user note may use same PV; handle gracefully
+)
+TREND_SIGNAL_SUFFIXES = (("PosAct", "-PosAct"), ("PosSet", "-PosSet"), ("PosErr", "-PosErr"))
+
+_QSS_RBV_MOVING = "QLineEdit { font-size: 14px; font-weight: 700; background: #fff1c9; border: 2px solid #f39c12; color: #111; }"
+_QSS_RBV_IDLE = "QLineEdit { font-size: 14px; font-weight: 700; background: #eef6ff; border: 2px solid #6f97c6; }"
+_QSS_LBL_MOVING = "QLabel { background: #ffd89a; color: #5a3200; font-weight: 700; padding: 2px 6px; border: 1px solid #cf8d2a; }"
+_QSS_LBL_IDLE = "QLabel { background: #d8ead2; color: #173b17; font-weight: 700; padding: 2px 6px; border: 1px solid #9fbe95; }"
+_QSS_DRIVE_ENABLED = (
+    "QPushButton { background: #22c55e; color: #062b12; font-weight: 700; border: 1px solid #168a42; padding: 4px 8px; }"
+    "QPushButton:pressed { background: #1faa52; }"
+)
+_QSS_DRIVE_DISABLED = (
+    "QPushButton { background: #e6e6e6; color: #222; font-weight: 700; border: 1px solid #a8a8a8; padding: 4px 8px; }"
+    "QPushButton:pressed { background: #d7d7d7; }"
+)
+
+
+def _motion_spin(value, minimum=-1e9, maximum=1e9):
+    # Line-edit look, but the value is held as a float (no text parsing on click).
+    spin = CompactDoubleSpinBox()
+    spin.setButtonSymbols(QtWidgets.QAbstractSpinBox.NoButtons)
+    spin.setKeyboardTracking(False)
+    # Enough decimals that typed and PV-initialised values are not rounded.
+    spin.setDecimals(15)
+    spin.setRange(minimum, maximum)
+    spin.setValue(value)
+    return spin
+
+
+def _spin_value(spin):
+    # Without keyboard tracking, value() lags typed text until Enter/focus-out;
+    # a button click does not always take focus, so commit the text first.
+    spin.interpretText()
+    return spin.value()
+
 
 def _to_float(text, name):
     s = str(text).strip()
@@ -38,11 +97,19 @@ def _to_int(text, name):
     return int(float(s))
 
 
+# EPICS enum-as-string labels included, so common values need one set lookup.
+_TRUTHY_PV_TEXT = frozenset({"1", "1.0", "true", "yes", "on", "enable", "enabled"})
+_FALSY_PV_TEXT = frozenset({"0", "0.0", "false", "no", "off", "disable", "disabled"})
+
+
 def _truthy_pv(v):
+    # Native numeric reads (monitor values, as_string=False) need no text parsing.
+    if type(v) is int or type(v) is float:
+        return v != 0
     s = str(v).strip().strip('"').lower()
-    if s in {"1", "true", "yes", "on"}:
+    if s in _TRUTHY_PV_TEXT:
         return True
-    if s in {"0", "false", "no", "off"}:
+    if s in _FALSY_PV_TEXT:
         return False
     # EPICS enum-as-string values (common for motor record menu fields)
     if s.startswith("enab"):
@@ -55,6 +122,26 @@ def _truthy_pv(v):
         return False
 
 
+def _status_float(text):
+    try:
+        return float(text)
+    except (TypeError, ValueError):
+        return None
+
+
+_CNEN_NUMERIC_STATES = {"0": False, "1": True, "0.0": False, "1.0": True}
+
+
+def _parse_cnen(v):
+    # Explicit numeric CNEN semantics first (1=enabled, 0=disabled), then the
+    # generic enum/text parsing.
+    s = str(v).strip().strip('"')
+    state = _CNEN_NUMERIC_STATES.get(s)
+    if state is not None:
+        return state
+    return _truthy_pv(s)
+
+
 def _normalize_axis_object_id(value):
     s = str(value or "").strip().strip('"')
     if not s:
@@ -85,13 +172,42 @@ def _normalize_axis_type_text(value):
     return s
 
 
+class StatusReadWorker(QtCore.QObject):
+    results_ready = Signal(int, object)
+
+    def __init__(self, client):
+        super().__init__()
+        # Not the window's client: EpicsClient's PV caches and backend
+        # fallback are not safe to share between threads.
+        self.client = client
+        self._ca_attached = False
+
+    @Slot(int, object)
+    def read(self, req_id, pvs):
+        if not self._ca_attached:
+            self._ca_attached = True
+            if self.client.backend == "pyepics":
+                # pyepics channels must be used from the shared CA context.
+                self.client._epics.ca.use_initial_context()
+        try:
+            result = self.client.get_many(pvs, as_string=True)
+        except Exception as ex:
+            result = {pv: ex for pv in pvs}
+        self.results_ready.emit(req_id, result)
+
+
 class MiniTrendWidget(QtWidgets.QWidget):
     def __init__(self, title, series_defs, max_points=40):
         super().__init__()
         self.title = str(title)
         # series_defs: list[(name, color_hex)]
         self.series_defs = [(str(n), QtGui.QColor(c)) for n, c in series_defs]
-        self.data = {name: deque(maxlen=max(2, int(max_points))) for name, _c in self.series_defs}
+        # Preallocated per-series ring buffers sharing one write index, so all
+        # series stay aligned and appends never allocate.
+        self.capacity = max(2, int(max_points))
+        self.data = {name: [None] * self.capacity for name, _c in self.series_defs}
+        self._head = 0
+        self._count = 0
         self.setMinimumHeight(74)
         self.setMaximumHeight(92)
 
@@ -111,17 +227,35 @@ class MiniTrendWidget(QtWidgets.QWidget):
         return compact_float_text(x, sig_digits=4)
 
     def append_point(self, values_by_name):
-        for name, _c in self.series_defs:
-            v = values_by_name.get(name)
-            try:
-                self.data[name].append(float(v) if v is not None else None)
-            except Exception:
-                self.data[name].append(None)
+        self.append_points([values_by_name])
+
+    def append_points(self, rows):
+        # Append several samples and repaint once.
+        cap = self.capacity
+        for values_by_name in rows:
+            head = self._head
+            for name, _c in self.series_defs:
+                v = values_by_name.get(name)
+                try:
+                    self.data[name][head] = float(v) if v is not None else None
+                except Exception:
+                    self.data[name][head] = None
+            self._head = (head + 1) % cap
+            if self._count < cap:
+                self._count += 1
         self.update()
 
+    def _series_points(self, name):
+        buf = self.data[name]
+        if self._count < self.capacity:
+            return buf[:self._count]
+        return buf[self._head:] + buf[:self._head]
+
     def clear(self):
-        for q in self.data.values():
-            q.clear()
+        for name in self.data:
+            self.data[name] = [None] * self.capacity
+        self._head = 0
+        self._count = 0
         self.update()
 
     def paintEvent(self, _event):
@@ -140,9 +274,8 @@ class MiniTrendWidget(QtWidgets.QWidget):
             return
 
         # Collect min/max from visible numeric points.
-        vals = []
-        for name, _c in self.series_defs:
-            vals.extend([v for v in self.data[name] if isinstance(v, (int, float))])
+        series_pts = [(color, self._series_points(name)) for name, color in self.series_defs]
+        vals = [v for _color, pts in series_pts for v in pts if v is not None]
         if not vals:
             p.setPen(QtGui.QColor("#7a8794"))
             p.drawText(plot, QtCore.Qt.AlignCenter, "no data")
@@ -179,21 +312,19 @@ class MiniTrendWidget(QtWidgets.QWidget):
             p.drawText(zr, QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter, "0")
 
         # Plot each series
-        maxlen = max((len(self.data[name]) for name, _c in self.series_defs), default=0)
-        if maxlen <= 1:
-            maxlen = 2
-        for name, color in self.series_defs:
-            pts = list(self.data[name])
+        y_scale = plot.height() / (vmax - vmin)
+        for color, pts in series_pts:
             if not pts:
                 continue
+            x_step = plot.width() / max(1, len(pts) - 1)
             path = QtGui.QPainterPath()
             started = False
             for i, v in enumerate(pts):
                 if v is None:
                     started = False
                     continue
-                x = plot.left() + (plot.width() * i / max(1, len(pts) - 1))
-                y = plot.bottom() - (plot.height() * (float(v) - vmin) / (vmax - vmin))
+                x = plot.left() + x_step * i
+                y = plot.bottom() - (v - vmin) * y_scale
                 pt = QtCore.QPointF(x, y)
                 if not started:
                     path.moveTo(pt)
@@ -254,6 +385,9 @@ class _MotionPvMixin:
 
 
 class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
+    status_read_requested = Signal(int, object)
+    status_monitor_updated = Signal()
+
     def __init__(self, prefix, axis_id, timeout, axis_id_was_provided=True):
         super().__init__()
         self._base_title = "ecmc Axis Motion Control"
@@ -266,28 +400,76 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
         self.resize(590, 290)
 
         self.client = EpicsClient(timeout=timeout)
+        # Polled status reads run on a worker thread with its own client
+        # (queued signals both ways).
+        self._status_read_seq = 0
+        self._status_read_pending = False
+        self._status_read_request = None
+        self._status_thread = QtCore.QThread(self)
+        self._status_worker = None
+        if self.client.backend in ("pyepics", "cli"):
+            # epicsPV has no CA context attach for other threads; it keeps
+            # reading on the GUI thread.
+            self._status_worker = StatusReadWorker(EpicsClient(timeout=timeout))
+            self._status_worker.moveToThread(self._status_thread)
+            self.status_read_requested.connect(self._status_worker.read)
+            self._status_worker.results_ready.connect(self._on_status_read_done)
+            self._status_thread.start()
+        # Emitted from pyepics' CA callback thread; queued into the GUI thread.
+        self.status_monitor_updated.connect(self._on_status_monitor_updated, QtCore.Qt.QueuedConnection)
         self.default_prefix = str(prefix or "").strip()
         self.default_axis_id = str(axis_id or "1").strip() or "1"
         self._axis_id_was_provided = bool(axis_id_was_provided)
 
         self._seq_active = False
-        self._seq_idle_until = None
+        # Dwell at each sequence point; fires once when the idle time is over.
+        self._seq_idle_timer = QtCore.QTimer(self)
+        self._seq_idle_timer.setSingleShot(True)
+        self._seq_idle_timer.timeout.connect(self._sequence_advance_target)
         self._seq_next_target = None
         self._seq_params = {}
         self._seq_scan_points = []
         self._seq_scan_dir = 1
         self._seq_scan_idx = 0
-        self._seq_timer = QtCore.QTimer(self)
-        self._seq_timer.setInterval(250)
-        self._seq_timer.timeout.connect(self._sequence_tick)
+        self._seq_move_issued_at = 0.0
+        self._seq_seen_moving = False
+        # Bounded, so a flood of errors while nobody reads the log stays cheap.
+        self._log_queue = deque(maxlen=2000)
+        self._log_ts_sec = -1
+        self._log_ts_str = ""
+        self._log_flush_timer = QtCore.QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(200)
+        self._log_flush_timer.timeout.connect(self._flush_log)
         self._status_timer = QtCore.QTimer(self)
-        self._status_timer.setInterval(200)
+        self._status_poll_ms = 200
+        self._status_monitor_pvs = {}
+        self._status_monitor_values = {}
+        self._status_monitor_times = {}
+        self._status_monitor_since = 0.0
+        self._status_monitor_dirty = False
+        # Hold-off after applying pushed values, so a burst of monitor updates
+        # relabels the status group at most every 50 ms.
+        self._status_monitor_holdoff = QtCore.QTimer(self)
+        self._status_monitor_holdoff.setSingleShot(True)
+        self._status_monitor_holdoff.setInterval(50)
+        self._status_monitor_holdoff.timeout.connect(self._on_status_monitor_updated)
+        self._status_use_monitor = False
+        self._status_timer.setInterval(self._status_poll_ms)
         self._status_timer.timeout.connect(self._periodic_status_tick)
         self._spinner_chars = ["|", "/", "-", "\\"]
-        self._spinner_index = 0
-        self._last_rbv_text = None
+        self._spinner_iter = itertools.cycle(self._spinner_chars)
+        self._last_spin_time = 0.0
+        self._last_rbv_num = None
+        self._motion_flag_cache = {}
+        self._last_motion_style_state = False
+        self._last_drive_style_state = None
+        self._cnen_last_raw = None
+        self._cnen_last_parsed = None
+        self._cnen_state = None
         self._positions_initialized = False
         self._trend_monitor_values = {"PosAct": None, "PosSet": None, "PosErr": None}
+        self._trend_monitor_queues = {name: deque(maxlen=64) for name in self._trend_monitor_values}
         self._trend_monitor_pvs = {}
         self._trend_use_monitor = False
         self._active_motion_mode = None
@@ -296,18 +478,38 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
         self._did_startup_axis_presence_check = False
         self._startup_axis_probe_ok = False
         self._last_status_vals = {}
+        self._last_status_time = 0.0
+        self._status_shown_raw = {}
         self._axis_combo_updating = False
         self._axis_combo_open_new_instance = False
         self._ioc_connected = None
         self._scan_abort_on_reconnect = False
         self._local_motion_started = False
         self._ioc_connect_error_streak = 0
+        self._pv_cache = {}
+        self._suffix_pv_cache = {}
+        self._trend_pv_items = ()
+        self._status_layout = None
+        self._motor_name_candidates = None
+        self._motor_record_base = ""
+        self._motor_record_configured = False
+        # Optional widgets are created by _build_ui(); predefine them so the
+        # polling paths can use plain "is not None" checks.
+        self.status_extra_fields = {}
+        self.motion_vmax_edit = None
+        self.motion_accs_edit = None
+        self.tweak_step_edit = None
+        self.move_relative_chk = None
+        self.trends_group = None
+        self.trend_pos_widget = None
+        self.trend_err_widget = None
 
         self._build_ui(timeout)
         self._log(f"Connected via backend: {self.client.backend}")
         if getattr(self.client, "backend", None) == "cli":
             # CLI mode spawns caget/caput processes; lower poll rate to keep UI responsive.
-            self._status_timer.setInterval(900)
+            self._status_poll_ms = 900
+            self._status_timer.setInterval(self._status_poll_ms)
             self._log("CLI backend detected: status polling set to 900 ms")
         self._status_timer.start()
         QtCore.QTimer.singleShot(0, self._startup_axis_presence_check)
@@ -397,6 +599,7 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
         self.motor_name_cfg_pv_edit = QtWidgets.QLineEdit()
         self.motor_record_edit = QtWidgets.QLineEdit("")
         self.motor_record_edit.setPlaceholderText("Resolved motor record base PV (editable override)")
+        self.motor_record_edit.textChanged.connect(self._on_motor_record_changed)
 
         self.auto_refresh_status = QtWidgets.QCheckBox("Refresh status after actions")
         self.auto_refresh_status.setChecked(True)
@@ -498,7 +701,8 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
 
     def _apply_axis_top(self):
         axis_txt = self.axis_edit.text().strip() or self.default_axis_id
-        self.axis_edit.setText(axis_txt)
+        if axis_txt != self.axis_edit.text():
+            self.axis_edit.setText(axis_txt)
         if self._seq_active or self._active_motion_mode in {"move", "jog", "sequence"} or self._is_motor_moving:
             try:
                 self._log(f"Axis change requested while motion active; stopping motion before switching to axis {axis_txt}")
@@ -506,7 +710,7 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
             except Exception as ex:
                 self._log(f"Failed to stop motion during axis change: {ex}")
             self._close_jog_stop_dialog()
-        self._update_cfg_pv_edits()
+        self._update_cfg_pv_edits(axis_id=axis_txt)
         self._positions_initialized = False
         self._sync_axis_combo_to_axis_id(axis_txt)
         self.resolve_motor_record_name()
@@ -892,8 +1096,8 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
         l.setContentsMargins(6, 6, 6, 6)
         l.setHorizontalSpacing(4)
         l.setVerticalSpacing(3)
-        self.motion_velo_edit = QtWidgets.QLineEdit("1")
-        self.motion_acc_edit = QtWidgets.QLineEdit("1")
+        self.motion_velo_edit = _motion_spin(1.0, minimum=0.0)
+        self.motion_acc_edit = _motion_spin(1.0, minimum=0.0)
         self.motion_vmax_edit = QtWidgets.QLineEdit("")
         self.motion_accs_edit = QtWidgets.QLineEdit("")
         self.motion_vmax_edit.setPlaceholderText("optional")
@@ -944,7 +1148,7 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
         l.setHorizontalSpacing(4)
         l.setVerticalSpacing(3)
 
-        self.move_pos_edit = QtWidgets.QLineEdit("0")
+        self.move_pos_edit = _motion_spin(0.0)
         self.move_pos_edit.setMaximumHeight(22)
         self.move_pos_edit.setMaximumWidth(106)
         self.move_relative_chk = QtWidgets.QCheckBox("Rel")
@@ -974,9 +1178,9 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
         l.setHorizontalSpacing(4)
         l.setVerticalSpacing(3)
 
-        self.seq_a_edit = QtWidgets.QLineEdit("0")
-        self.seq_b_edit = QtWidgets.QLineEdit("10")
-        self.seq_idle_edit = QtWidgets.QLineEdit("0")
+        self.seq_a_edit = _motion_spin(0.0)
+        self.seq_b_edit = _motion_spin(10.0)
+        self.seq_idle_edit = _motion_spin(0.0, minimum=0.0, maximum=86400.0)
         self.seq_steps_edit = QtWidgets.QLineEdit("1")
         self.seq_snake_chk = QtWidgets.QCheckBox("Snake")
         self.seq_snake_chk.setChecked(True)
@@ -1091,9 +1295,7 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
         self.rbv_motion_label.setMaximumHeight(22)
         self.rbv_motion_label.setAlignment(QtCore.Qt.AlignCenter)
         self.rbv_motion_label.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        self.rbv_motion_label.setStyleSheet(
-            "QLabel { background: #d8ead2; color: #173b17; font-weight: 700; padding: 2px 6px; border: 1px solid #9fbe95; }"
-        )
+        self.rbv_motion_label.setStyleSheet(_QSS_LBL_IDLE)
         names = [("VAL", 0, 0), ("RBV", 0, 2), ("DMOV", 0, 4), ("VELO", 1, 0), ("ACCL", 1, 2), ("VMAX", 1, 4), ("CNEN", 1, 6)]
         for name, r, c in names:
             l.addWidget(QtWidgets.QLabel(name), r, c)
@@ -1106,9 +1308,7 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
                 e.setMinimumWidth(90)
                 e.setMaximumWidth(104)
                 e.setMaximumHeight(28)
-                e.setStyleSheet(
-                    "QLineEdit { font-size: 14px; font-weight: 700; background: #eef6ff; border: 2px solid #6f97c6; }"
-                )
+                e.setStyleSheet(_QSS_RBV_IDLE)
             else:
                 e.setStyleSheet(ro_style)
             l.addWidget(e, r, c + 1)
@@ -1163,9 +1363,26 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
 
     def _set_timeout(self, value):
         self.client.timeout = float(value)
+        if self._status_worker is not None:
+            self._status_worker.client.timeout = float(value)
 
     def _log(self, msg):
-        self.log.appendPlainText(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+        # Queue lines and append them in one batch; error-heavy polls would
+        # otherwise relayout the log widget once per message.
+        sec = int(time.time())
+        if sec != self._log_ts_sec:
+            self._log_ts_sec = sec
+            self._log_ts_str = time.strftime("%H:%M:%S", time.localtime(sec))
+        self._log_queue.append(f"[{self._log_ts_str}] {msg}")
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log(self):
+        lines = []
+        while self._log_queue:
+            lines.append(self._log_queue.popleft())
+        if lines:
+            self.log.appendPlainText("\n".join(lines))
 
     def _axis_id_text(self):
         return self.axis_edit.text().strip() or self.default_axis_id
@@ -1186,7 +1403,6 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
         return bool(
             self._local_motion_started
             or self._seq_active
-            or self._seq_timer.isActive()
             or self._active_motion_mode in {"move", "tweak", "jog", "sequence"}
         )
 
@@ -1395,37 +1611,79 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
             return
         item.setFlags(item.flags() | QtCore.Qt.ItemIsEnabled)
 
-    def _update_cfg_pv_edits(self):
-        prefix = self.prefix_edit.text().strip()
-        axis_id = self._axis_id_text()
+    def _update_cfg_pv_edits(self, axis_id=None, prefix=None):
+        # Callers that already hold the axis/prefix text pass it in.
+        if prefix is None:
+            prefix = self.prefix_edit.text().strip()
+        if axis_id is None:
+            axis_id = self._axis_id_text()
         axis_pfx_pv = _join_prefix_pv(prefix, f"MCU-Cfg-AX{axis_id}-Pfx")
-        self.axis_pfx_cfg_pv_edit.setText(axis_pfx_pv)
+        if axis_pfx_pv != self.axis_pfx_cfg_pv_edit.text():
+            self.axis_pfx_cfg_pv_edit.setText(axis_pfx_pv)
 
         # Motor name/suffix is expected in ...-Nam.
         guessed = _join_prefix_pv(prefix, f"MCU-Cfg-AX{axis_id}-Nam")
-        if not self.motor_name_cfg_pv_edit.text().strip() or "MCU-Cfg-AX" in self.motor_name_cfg_pv_edit.text():
+        cur = self.motor_name_cfg_pv_edit.text()
+        if not cur.strip() or "MCU-Cfg-AX" in cur:
             self.motor_name_cfg_pv_edit.setText(guessed)
 
-    def _pv(self, field):
-        base = self.motor_record_edit.text().strip()
+    def _on_motor_record_changed(self, text):
+        base = str(text or "").strip()
+        if base != self._motor_record_base and self._status_use_monitor:
+            # Monitors belong to the previous base; poll until the next resolve.
+            self._clear_status_monitors()
+        self._motor_record_base = base
+        self._motor_record_configured = bool(base)
+        self._rebuild_pv_cache()
+
+    def _rebuild_pv_cache(self):
+        # PV names only depend on the motor record base, so build them once per
+        # base change instead of formatting strings on every poll tick.
+        self._pv_cache = {}
+        self._suffix_pv_cache = {}
+        self._trend_pv_items = ()
+        self._status_layout = None
+        base = self._motor_record_base
         if not base:
-            raise RuntimeError("Motor record is not resolved")
-        return f"{base}.{field}"
+            return
+        for field in MOTOR_RECORD_CACHED_FIELDS:
+            self._pv_cache[field] = f"{base}.{field}"
+        for suffix in MOTOR_SUFFIX_CACHED_PVS:
+            self._suffix_pv_cache[suffix] = f"{base}{suffix}"
+        self._trend_pv_items = tuple((key, f"{base}{suffix}") for key, suffix in TREND_SIGNAL_SUFFIXES)
+
+    def _prewarm_connections(self, wait=0.5):
+        # Connect status/motion/trend channels together once after resolve,
+        # so the first poll does not stall on serial channel searches.
+        pvs = list(self._pv_cache.values()) + list(self._suffix_pv_cache.values())
+        try:
+            self.client.prewarm(pvs, wait=wait)
+        except Exception as ex:
+            self._log(f"PV prewarm failed: {ex}")
+
+    def _pv(self, field):
+        pv = self._pv_cache.get(field)
+        if pv is None:
+            pv = f"{self._motor_base()}.{field}"
+            self._pv_cache[field] = pv
+        return pv
 
     def _motor_base(self):
-        base = self.motor_record_edit.text().strip()
-        if not base:
+        if not self._motor_record_configured:
             raise RuntimeError("Motor record is not resolved")
-        return base
+        return self._motor_record_base
 
     def _motor_suffix_pv(self, suffix):
+        pv = self._suffix_pv_cache.get(suffix)
+        if pv is not None:
+            return pv
         base = self._motor_base()
         s = str(suffix or "").strip()
         if not s:
             raise RuntimeError("Empty motor suffix")
-        if s.startswith((".", "-", ":")):
-            return f"{base}{s}"
-        return f"{base}{s}"
+        pv = f"{base}{s}"
+        self._suffix_pv_cache[suffix] = pv
+        return pv
 
     def _put(self, field, value, quiet=False, wait=False):
         pv = self._pv(field)
@@ -1436,6 +1694,24 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
             mode = "wait" if wait else "nowait"
             self._log(f"PUT [{mode}] {pv} = {value}")
 
+    def _put_many(self, items, quiet=False, quiet_fields=()):
+        # One grouped non-blocking write; only failed fields are retried one by one
+        # so callers still get a per-field error.
+        pairs = [(self._pv(field), value) for field, value in items]
+        failed = {pv for pv, _ex in self.client.put_many(pairs, wait=False)}
+        errors = {}
+        for (field, value), (pv, _value) in zip(items, pairs):
+            field_quiet = quiet or field in quiet_fields
+            if pv not in failed:
+                if not field_quiet:
+                    self._log(f"PUT [nowait] {pv} = {value}")
+                continue
+            try:
+                self._put(field, value, quiet=field_quiet)
+            except Exception as ex:
+                errors[field] = ex
+        return errors
+
     def _get(self, field):
         pv = self._pv(field)
         val = self.client.get(pv, as_string=True)
@@ -1474,11 +1750,13 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
             resolved = self._combine_motor_record(axis_pfx, motor_name)
             self.motor_record_edit.setText(resolved)
             self._update_window_title()
-            if hasattr(self, "trend_pos_widget"):
+            if self.trend_pos_widget is not None:
                 self.trend_pos_widget.clear()
-            if hasattr(self, "trend_err_widget"):
+            if self.trend_err_widget is not None:
                 self.trend_err_widget.clear()
             self._setup_trend_monitors()
+            self._setup_status_monitors()
+            self._prewarm_connections()
             self._log(f"Resolved motor record: {resolved} (axis_pfx='{axis_pfx}', motor='{motor_name}')")
             vals = self.refresh_status()
             self._init_shared_motion_settings_from_pv()
@@ -1490,15 +1768,12 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
     def _candidate_motor_name_pvs(self):
         prefix = self.prefix_edit.text().strip()
         axis_id = self._axis_id_text()
-        suffixes = [
-            f"MCU-Cfg-AX{axis_id}-Nam",
-            f"MCU-Cfg-AX{axis_id}-Mtr",
-            f"MCU-Cfg-AX{axis_id}-MtrName",
-            f"MCU-Cfg-AX{axis_id}-Motor",
-            f"MCU-Cfg-AX{axis_id}-MotorName",
-            f"MCU-Cfg-AX{axis_id}-Pfx",  # user note may use same PV; handle gracefully
-        ]
-        return [_join_prefix_pv(prefix, s) for s in suffixes]
+        cached = self._motor_name_candidates
+        if cached is not None and cached[0] == (prefix, axis_id):
+            return list(cached[1])
+        pvs = [_join_prefix_pv(prefix, fmt.format(ax=axis_id)) for fmt in MOTOR_NAME_SUFFIX_FMTS]
+        self._motor_name_candidates = ((prefix, axis_id), pvs)
+        return list(pvs)
 
     def _combine_motor_record(self, axis_pfx, motor_name):
         a = str(axis_pfx or "").strip()
@@ -1512,83 +1787,84 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
             return f"{a}:{m}"
         return a or m
 
-    def _set_move_params(self, velo, accl, accs=None, vmax=None):
+    def _optional_motion_param_items(self, accs=None, vmax=None):
+        items = []
         if vmax is not None:
-            try:
-                self._put("VMAX", vmax)
-            except Exception as ex:
-                self._log(f"VMAX unavailable ({ex})")
+            items.append(("VMAX", vmax))
         if accs is not None:
-            try:
-                self._put("ACCS", accs)
-            except Exception as ex:
-                self._log(f"ACCS unavailable ({ex})")
-        self._put("VELO", velo)
-        self._put("ACCL", accl)
+            items.append(("ACCS", accs))
+        return items
+
+    def _log_optional_param_errors(self, errors):
+        for field in ("VMAX", "ACCS"):
+            if field in errors:
+                self._log(f"{field} unavailable ({errors[field]})")
+
+    def _set_move_params(self, velo, accl, accs=None, vmax=None):
+        items = self._optional_motion_param_items(accs=accs, vmax=vmax)
+        items.extend([("VELO", velo), ("ACCL", accl)])
+        errors = self._put_many(items)
+        self._log_optional_param_errors(errors)
+        for field in ("VELO", "ACCL"):
+            if field in errors:
+                raise errors[field]
 
     def _set_jog_params(self, velo, accl, accs=None, vmax=None):
-        if vmax is not None:
-            try:
-                self._put("VMAX", vmax)
-            except Exception as ex:
-                self._log(f"VMAX unavailable ({ex})")
-        if accs is not None:
-            try:
-                self._put("ACCS", accs)
-            except Exception as ex:
-                self._log(f"ACCS unavailable ({ex})")
-        self._put("ACCL", accl)
-        try:
-            self._put("JVEL", velo)
-        except Exception as ex:
-            self._log(f"JVEL unavailable, using VELO ({ex})")
+        items = self._optional_motion_param_items(accs=accs, vmax=vmax)
+        items.extend([("ACCL", accl), ("JVEL", velo)])
+        errors = self._put_many(items)
+        self._log_optional_param_errors(errors)
+        if "ACCL" in errors:
+            raise errors["ACCL"]
+        if "JVEL" in errors:
+            self._log(f"JVEL unavailable, using VELO ({errors['JVEL']})")
             self._put("VELO", velo)
 
     def _shared_motion_params(self):
-        velo = _to_float(self.motion_velo_edit.text(), "VELO/JVEL")
-        accl = _to_float(self.motion_acc_edit.text(), "ACCL")
-        vmax_txt = self.motion_vmax_edit.text().strip() if hasattr(self, "motion_vmax_edit") else ""
-        accs_txt = self.motion_accs_edit.text().strip() if hasattr(self, "motion_accs_edit") else ""
+        velo = _spin_value(self.motion_velo_edit)
+        accl = _spin_value(self.motion_acc_edit)
+        vmax_txt = self.motion_vmax_edit.text().strip() if self.motion_vmax_edit is not None else ""
+        accs_txt = self.motion_accs_edit.text().strip() if self.motion_accs_edit is not None else ""
         vmax = _to_float(vmax_txt, "VMAX") if vmax_txt else None
         accs = _to_float(accs_txt, "ACCS") if accs_txt else None
         return velo, accl, accs, vmax
 
     def _init_shared_motion_settings_from_pv(self):
-        if not self.motor_record_edit.text().strip():
+        if not self._motor_record_configured:
             return
         try:
-            v = self.client.get(self._pv("VELO"), as_string=True)
-            self.motion_velo_edit.setText(compact_float_text(v))
+            v = self.client.get(self._pv("VELO"), as_string=False)
+            self.motion_velo_edit.setValue(_to_float(v, "VELO"))
         except Exception as ex:
             self._log(f"Init VELO from PV failed: {ex}")
         try:
-            a = self.client.get(self._pv("ACCL"), as_string=True)
-            self.motion_acc_edit.setText(compact_float_text(a))
+            a = self.client.get(self._pv("ACCL"), as_string=False)
+            self.motion_acc_edit.setValue(_to_float(a, "ACCL"))
         except Exception as ex:
             self._log(f"Init ACCL from PV failed: {ex}")
         try:
-            vm = self.client.get(self._pv("VMAX"), as_string=True)
+            vm = self.client.get(self._pv("VMAX"), as_string=False)
             self.motion_vmax_edit.setText(compact_float_text(vm))
         except Exception:
-            if hasattr(self, "motion_vmax_edit"):
+            if self.motion_vmax_edit is not None:
                 self.motion_vmax_edit.setText("")
         # ACCS is optional on some motor records.
         try:
-            s = self.client.get(self._pv("ACCS"), as_string=True)
+            s = self.client.get(self._pv("ACCS"), as_string=False)
             self.motion_accs_edit.setText(compact_float_text(s))
         except Exception:
-            if hasattr(self, "motion_accs_edit"):
+            if self.motion_accs_edit is not None:
                 self.motion_accs_edit.setText("")
         try:
-            t = self.client.get(self._pv("TWV"), as_string=True)
-            if hasattr(self, "tweak_step_edit"):
+            t = self.client.get(self._pv("TWV"), as_string=False)
+            if self.tweak_step_edit is not None:
                 self.tweak_step_edit.setText(compact_float_text(t))
         except Exception:
             pass
 
     def _refresh_status_if_enabled(self):
         if self.auto_refresh_status.isChecked():
-            self.refresh_status()
+            self._request_status_refresh()
 
     def _looks_like_connection_error(self, ex):
         msg = str(ex or "").lower()
@@ -1677,34 +1953,118 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
             self._log(f"Reconnect safety stop failed: {ex}")
             return False
 
+    def _status_read_layout(self):
+        # Built once per motor base (reset by _rebuild_pv_cache).
+        if self._status_layout is not None:
+            return self._status_layout
+        # (field, pv, widget) rows so the apply loop needs no per-tick lookups.
+        fields = tuple((f, self._pv(f), w) for f, w in self.status_fields.items())
+        extras = tuple(
+            (name, self._motor_suffix_pv(suffix), self.status_extra_fields[name])
+            for name, suffix in (("ErrId", "-ErrId"), ("MsgTxt", "-MsgTxt"))
+            if self.status_extra_fields.get(name) is not None
+        )
+        status_pvs = tuple([pv for _f, pv, _w in fields] + [pv for _name, pv, _w in extras])
+        self._status_layout = (fields, extras, status_pvs)
+        return self._status_layout
+
     def refresh_status(self):
-        if not self.motor_record_edit.text().strip():
+        if not self._motor_record_configured:
             return {}
+        read_time = time.monotonic()
+        fields, extras, status_pvs = self._status_read_layout()
+        # All status PVs are read in one batch; failed reads come back as exceptions.
+        # Displayed values keep the IOC formatting (PREC/enum strings).
+        if self._status_use_monitor:
+            raw_by_pv = self._status_values_from_monitors(status_pvs)
+            if not raw_by_pv:
+                # Monitors still connecting; nothing to show yet.
+                return {}
+        else:
+            raw_by_pv = self.client.get_many(status_pvs, as_string=True)
+        return self._apply_status_values(raw_by_pv, fields, extras, read_time)
+
+    def _request_status_refresh(self, advance_sequence=True):
+        # Polling backends read on the worker thread so slow IOCs/caget
+        # processes do not stall the UI; monitor values are already local.
+        if not self._motor_record_configured:
+            return
+        if self._status_use_monitor or self._status_worker is None:
+            self.refresh_status()
+            # The sequence advances off each applied status read (same DMOV),
+            # except right after its own VAL put.
+            if advance_sequence and self._seq_active:
+                self._sequence_tick()
+            return
+        if self._status_read_pending:
+            return
+        fields, extras, status_pvs = self._status_read_layout()
+        self._status_read_seq += 1
+        self._status_read_pending = True
+        self._status_read_request = (self._status_read_seq, fields, extras, time.monotonic())
+        self.status_read_requested.emit(self._status_read_seq, status_pvs)
+
+    def _on_status_read_done(self, req_id, raw_by_pv):
+        self._status_read_pending = False
+        req = self._status_read_request
+        self._status_read_request = None
+        # Drop results for an older request or a motor base that changed meanwhile.
+        if req is None or req[0] != req_id or not self._motor_record_configured:
+            return
+        _req_id, fields, extras, read_time = req
+        if set(self._status_read_layout()[2]) != set(raw_by_pv.keys()):
+            return
+        try:
+            self._apply_status_values(raw_by_pv, fields, extras, read_time)
+            if self._seq_active:
+                self._sequence_tick()
+        except Exception as ex:
+            self._log(f"Status update failed: {ex}")
+
+    def _apply_status_values(self, raw_by_pv, fields, extras, read_time):
         vals = {}
         ok_reads = 0
         cannot_connect = False
         critical_fields = {"VAL", "RBV", "DMOV", "CNEN"}
-        for f in list(self.status_fields.keys()):
+        rbv_num = None
+        shown_raw = self._status_shown_raw
+        for f, pv, w in fields:
+            if pv not in raw_by_pv:
+                continue
             try:
-                raw = self.client.get(self._pv(f), as_string=True)
-                vals[f] = str(raw).strip()
-                txt = compact_float_text(raw)
-                self.status_fields[f].setText(txt)
+                raw = raw_by_pv[pv]
+                if isinstance(raw, Exception):
+                    raise raw
+                raw_s = str(raw)
+                txt = raw_s.strip()
+                vals[f] = txt
+                if f == "RBV":
+                    rbv_num = _status_float(txt)
+                # Format and relabel only when the raw value changed.
+                if shown_raw.get(f) != raw_s:
+                    shown_raw[f] = raw_s
+                    shown = compact_float_text(raw)
+                    if shown != w.text():
+                        w.setText(shown)
                 ok_reads += 1
             except Exception as ex:
-                self.status_fields[f].setText(f"ERR: {ex}")
+                shown_raw.pop(f, None)
+                w.setText(f"ERR: {ex}")
                 vals[f] = None
                 if f in critical_fields or self._looks_like_connection_error(ex):
                     cannot_connect = True
-        for name, suffix in (("ErrId", "-ErrId"), ("MsgTxt", "-MsgTxt")):
-            w = self.status_extra_fields.get(name) if hasattr(self, "status_extra_fields") else None
-            if w is None:
+        for name, pv, w in extras:
+            if pv not in raw_by_pv:
                 continue
             try:
-                raw = self.client.get(self._motor_suffix_pv(suffix), as_string=True)
+                raw = raw_by_pv[pv]
+                if isinstance(raw, Exception):
+                    raise raw
                 txt = str(raw).strip()
                 vals[name] = txt
-                w.setText(compact_float_text(txt) if name == "ErrId" else txt)
+                shown = compact_float_text(txt) if name == "ErrId" else txt
+                if shown != w.text():
+                    w.setText(shown)
                 ok_reads += 1
             except Exception as ex:
                 vals[name] = None
@@ -1720,12 +2080,21 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
         # Treat any explicit channel-access "cannot connect to ..." as disconnected,
         # even if some other PVs still read successfully.
         self._handle_ioc_connection_state(False if cannot_connect else (ok_reads > 0))
-        self._update_motion_indicator(vals)
+        self._update_motion_indicator(vals, rbv_num)
         self._update_drive_enable_button_from_status(vals)
         self._update_active_mode_from_status(vals)
         self._last_status_vals = dict(vals)
+        # Stamp with the time the read was issued, so a move commanded while
+        # a read was in flight never sees that read as "after the move".
+        self._last_status_time = read_time
         return vals
 
+    def _cached_status_value(self, field, since=None):
+        # Last polled value, or None when unread/stale so callers can fall back.
+        if since is not None and self._last_status_time <= since:
+            return None
+        return self._last_status_vals.get(field)
+
     def _errid_active(self, vals=None):
         vals = dict(vals or getattr(self, "_last_status_vals", {}) or {})
         err = vals.get("ErrId")
@@ -1741,53 +2110,47 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
             return s.lower() not in {"0", "none", "ok"}
 
     def _set_drive_enable_button_style(self, enabled):
-        if enabled is True:
+        # Disabled and unknown share one look; only touch the widget on change.
+        state = enabled is True
+        if state == self._last_drive_style_state:
+            return
+        self._last_drive_style_state = state
+        if state:
             self.drive_enable_btn.setText("Enabled")
-            self.drive_enable_btn.setStyleSheet(
-                "QPushButton { background: #22c55e; color: #062b12; font-weight: 700; border: 1px solid #168a42; padding: 4px 8px; }"
-                "QPushButton:pressed { background: #1faa52; }"
-            )
-        elif enabled is False:
-            self.drive_enable_btn.setText("Enable")
-            self.drive_enable_btn.setStyleSheet(
-                "QPushButton { background: #e6e6e6; color: #222; font-weight: 700; border: 1px solid #a8a8a8; padding: 4px 8px; }"
-                "QPushButton:pressed { background: #d7d7d7; }"
-            )
+            self.drive_enable_btn.setStyleSheet(_QSS_DRIVE_ENABLED)
         else:
             self.drive_enable_btn.setText("Enable")
-            self.drive_enable_btn.setStyleSheet(
-                "QPushButton { background: #e6e6e6; color: #222; font-weight: 700; border: 1px solid #a8a8a8; padding: 4px 8px; }"
-                "QPushButton:pressed { background: #d7d7d7; }"
-            )
+            self.drive_enable_btn.setStyleSheet(_QSS_DRIVE_DISABLED)
 
     def _update_drive_enable_button_from_status(self, vals):
         cnen = vals.get("CNEN")
         if cnen is None:
+            self._cnen_last_raw = None
+            self._cnen_state = None
             self._set_drive_enable_button_style(None)
             return
-        s = str(cnen).strip().strip('"')
-        # Prefer explicit numeric CNEN semantics: 1=enabled, 0=disabled.
-        try:
-            n = int(float(s))
-            if n == 1:
-                self._set_drive_enable_button_style(True)
-                return
-            if n == 0:
-                self._set_drive_enable_button_style(False)
-                return
-        except Exception:
-            pass
-        self._set_drive_enable_button_style(_truthy_pv(s))
+        if cnen == self._cnen_last_raw:
+            return
+        self._cnen_last_raw = cnen
+        self._cnen_last_parsed = _parse_cnen(cnen)
+        self._cnen_state = self._cnen_last_parsed
+        self._set_drive_enable_button_style(self._cnen_last_parsed)
 
     def toggle_drive_enable(self):
         try:
-            cur = None
-            try:
-                cur = self.client.get(self._pv("CNEN"), as_string=True)
-            except Exception:
-                cur = None
-            next_val = 0 if _truthy_pv(cur) else 1
+            enabled = self._cnen_state
+            if enabled is None:
+                try:
+                    enabled = _parse_cnen(self.client.get(self._pv("CNEN"), as_string=True))
+                except Exception:
+                    enabled = False
+            next_val = 0 if enabled else 1
             self._put("CNEN", next_val)
+            # Show the new state right away; the next status read reconciles it
+            # (the raw-value memo is reset so an unchanged readback restyles).
+            self._cnen_state = bool(next_val)
+            self._cnen_last_raw = None
+            self._set_drive_enable_button_style(self._cnen_state)
             self._log(f"Drive {'enabled' if next_val else 'disabled'} (CNEN={next_val})")
             self._refresh_status_if_enabled()
         except Exception as ex:
@@ -1830,49 +2193,117 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
             return
         a_txt = compact_float_text(rbv)
         b_txt = compact_float_text(rbv + 1.0)
-        self.move_pos_edit.setText(a_txt)
-        self.seq_a_edit.setText(a_txt)
-        self.seq_b_edit.setText(b_txt)
+        self.move_pos_edit.setValue(rbv)
+        self.seq_a_edit.setValue(rbv)
+        self.seq_b_edit.setValue(rbv + 1.0)
         self._positions_initialized = True
         self._log(f"Initialized positions from RBV={a_txt} (PosA={a_txt}, PosB={b_txt})")
 
-    def _update_motion_indicator(self, vals):
-        rbv_now = vals.get("RBV")
-        movn = _truthy_pv(vals.get("MOVN")) if vals.get("MOVN") is not None else False
-        dmov = _truthy_pv(vals.get("DMOV")) if vals.get("DMOV") is not None else True
-        rbv_changed = (rbv_now is not None and self._last_rbv_text is not None and rbv_now != self._last_rbv_text)
+    def _motion_flag(self, field, raw, default):
+        # DMOV/MOVN are re-parsed only when their raw value changes.
+        if raw is None:
+            return default
+        cached = self._motion_flag_cache.get(field)
+        if cached is not None and cached[0] == raw:
+            return cached[1]
+        flag = _truthy_pv(raw)
+        self._motion_flag_cache[field] = (raw, flag)
+        return flag
+
+    def _update_motion_indicator(self, vals, rbv_num=None):
+        movn = self._motion_flag("MOVN", vals.get("MOVN"), False)
+        dmov = self._motion_flag("DMOV", vals.get("DMOV"), True)
+        # Compare RBV numerically so formatting-only differences (e.g. "1.50"
+        # vs "1.5") are not reported as motion.
+        last = self._last_rbv_num
+        rbv_changed = (
+            rbv_num is not None
+            and last is not None
+            and abs(rbv_num - last) > 1e-12 * max(1.0, abs(rbv_num), abs(last))
+        )
         moving = bool(movn or (not dmov) or rbv_changed)
         self._is_motor_moving = moving
-        self._last_rbv_text = rbv_now if rbv_now is not None else self._last_rbv_text
-
-        rbv_field = self.status_fields.get("RBV")
-        if rbv_field is not None:
-            if moving:
-                rbv_field.setStyleSheet(
-                    "QLineEdit { font-size: 14px; font-weight: 700; background: #fff1c9; border: 2px solid #f39c12; color: #111; }"
-                )
-            else:
-                rbv_field.setStyleSheet(
-                    "QLineEdit { font-size: 14px; font-weight: 700; background: #eef6ff; border: 2px solid #6f97c6; }"
-                )
+        if rbv_num is not None:
+            self._last_rbv_num = rbv_num
+
+        # Style sheets are only re-applied on a moving/idle transition; the
+        # spinner text is the only per-tick update while moving.
+        if moving != self._last_motion_style_state:
+            self._last_motion_style_state = moving
+            rbv_field = self.status_fields.get("RBV")
+            if rbv_field is not None:
+                rbv_field.setStyleSheet(_QSS_RBV_MOVING if moving else _QSS_RBV_IDLE)
+            self.rbv_motion_label.setStyleSheet(_QSS_LBL_MOVING if moving else _QSS_LBL_IDLE)
+            if not moving:
+                self.rbv_motion_label.setText("idle")
 
         if moving:
-            ch = self._spinner_chars[self._spinner_index % len(self._spinner_chars)]
-            self._spinner_index += 1
-            self.rbv_motion_label.setText(f"{ch} MOVING")
-            self.rbv_motion_label.setStyleSheet(
-                "QLabel { background: #ffd89a; color: #5a3200; font-weight: 700; padding: 2px 6px; border: 1px solid #cf8d2a; }"
-            )
-        else:
-            self.rbv_motion_label.setText("idle")
-            self.rbv_motion_label.setStyleSheet(
-                "QLabel { background: #d8ead2; color: #173b17; font-weight: 700; padding: 2px 6px; border: 1px solid #9fbe95; }"
-            )
+            # Monitor updates can arrive much faster than the poll cadence;
+            # keep the spinner (and its setText) at the poll rate.
+            now = time.monotonic()
+            if now - self._last_spin_time >= 0.9 * self._status_poll_ms / 1000.0:
+                self._last_spin_time = now
+                self.rbv_motion_label.setText(f"{next(self._spinner_iter)} MOVING")
+
+    def _is_window_hidden(self):
+        return bool(self.isMinimized() or not self.isVisible())
+
+    def _update_status_poll_rate(self):
+        # Poll slowly while minimized/hidden, unless this window is driving motion.
+        hidden_idle = self._is_window_hidden() and not self._is_local_motion_active()
+        interval = 2000 if hidden_idle else self._status_tick_ms()
+        if self._status_timer.interval() != interval:
+            self._status_timer.setInterval(interval)
+
+    def changeEvent(self, event):
+        if event.type() == QtCore.QEvent.WindowStateChange:
+            self._update_status_poll_rate()
+        super().changeEvent(event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._update_status_poll_rate()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._update_status_poll_rate()
+
+    def _status_tick_ms(self):
+        return self._status_poll_ms
+
+    def _on_status_monitor_updated(self):
+        if self._status_monitor_holdoff.isActive() or not self._status_monitor_dirty:
+            return
+        if self._is_window_hidden() and not self._is_local_motion_active():
+            # The slow hidden tick picks the values up later.
+            return
+        self._status_monitor_dirty = False
+        try:
+            self._request_status_refresh()
+        except Exception:
+            pass
+        self._status_monitor_holdoff.start()
 
     def _periodic_status_tick(self):
+        if self._is_window_hidden() and not self._is_local_motion_active():
+            self._update_status_poll_rate()
+            return
+        self._update_status_poll_rate()
+        if not self._motor_record_configured:
+            # Nothing to read until a motor record is resolved/entered.
+            return
         try:
-            self.refresh_status()
-            if hasattr(self, "trends_group") and self.trends_group.isVisible():
+            # With status monitors, pushed values are applied as they arrive
+            # (_on_status_monitor_updated); this tick still covers the trends,
+            # the sequence idle timeout and connection-state changes.
+            # _sequence_tick runs once the read is applied, reusing its DMOV.
+            self._status_monitor_dirty = False
+            self._request_status_refresh()
+            if (
+                self.trends_group is not None
+                and self.trends_group.isVisible()
+                and self.trend_pos_widget.isVisible()
+            ):
                 if self._trend_use_monitor:
                     self._append_trend_from_cached_monitors()
                 else:
@@ -1880,9 +2311,75 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
         except Exception:
             pass
 
+    def _clear_status_monitors(self):
+        for obj in list(self._status_monitor_pvs.values()):
+            self.client.clear_monitor(obj)
+        self._status_monitor_pvs = {}
+        self._status_monitor_values = {}
+        self._status_monitor_times = {}
+        self._status_use_monitor = False
+        self._update_status_poll_rate()
+
+    def _setup_status_monitors(self):
+        self._clear_status_monitors()
+        if not self._motor_record_configured:
+            return
+        pvs = self._status_read_layout()[2]
+        self._status_monitor_since = time.monotonic()
+
+        def _mark_dirty(**_kws):
+            if not self._status_monitor_dirty:
+                self._status_monitor_dirty = True
+                self.status_monitor_updated.emit()
+
+        def _cb_factory(pvname):
+            def _cb(value=None, char_value=None, **_kws):
+                self._status_monitor_values[pvname] = char_value if char_value is not None else value
+                # Stamped after the value, so a reader that sees the stamp also
+                # sees a value at least that new.
+                self._status_monitor_times[pvname] = time.monotonic()
+                if not self._status_monitor_dirty:
+                    self._status_monitor_dirty = True
+                    self.status_monitor_updated.emit()
+            return _cb
+
+        try:
+            for pvname in pvs:
+                # DBR_CTRL updates carry enum labels/PREC, so char_value matches
+                # the text of a string get.
+                obj = self.client.monitor(pvname, _cb_factory(pvname), form="ctrl", connection_callback=_mark_dirty)
+                if obj is None:
+                    return
+                self._status_monitor_pvs[pvname] = obj
+            self._status_use_monitor = True
+            self._update_status_poll_rate()
+            self._log("Status fields using pyepics monitors")
+        except Exception as ex:
+            self._clear_status_monitors()
+            self._log(f"Status monitor setup failed, using polling ({ex})")
+
+    def _status_values_from_monitors(self, pvs):
+        # Never blocks: a PV whose first monitor update is still on its way is
+        # left out (its field keeps its text). One that has not connected
+        # within the client timeout, or has dropped, is reported as an error.
+        out = {}
+        connecting = time.monotonic() - self._status_monitor_since < float(self.client.timeout)
+        for pv in pvs:
+            obj = self._status_monitor_pvs.get(pv)
+            val = self._status_monitor_values.get(pv)
+            if obj is not None and obj.connected:
+                if val is not None:
+                    out[pv] = val
+                continue
+            if val is None and connecting:
+                continue
+            out[pv] = RuntimeError(f"caget failed for {pv} (not connected)")
+        return out
+
     def _setup_trend_monitors(self):
         self._trend_use_monitor = False
         self._trend_monitor_values = {"PosAct": None, "PosSet": None, "PosErr": None}
+        self._trend_monitor_queues = {name: deque(maxlen=64) for name in self._trend_monitor_values}
         # Best effort cleanup of previous PV monitor objects.
         for _name, pv in list(self._trend_monitor_pvs.items()):
             try:
@@ -1899,7 +2396,7 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
 
         if getattr(self.client, "backend", None) != "pyepics" or getattr(self.client, "_epics", None) is None:
             return
-        if not self.motor_record_edit.text().strip():
+        if not self._motor_record_configured:
             return
         ep = self.client._epics
 
@@ -1907,13 +2404,13 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
             def _cb(pvname=None, value=None, char_value=None, **_kws):
                 v = value if value is not None else char_value
                 self._trend_monitor_values[sig_name] = v
+                self._trend_monitor_queues[sig_name].append(v)
             return _cb
 
         try:
-            mapping = {"PosAct": "-PosAct", "PosSet": "-PosSet", "PosErr": "-PosErr"}
-            for sig_name, suffix in mapping.items():
-                pvname = self._motor_suffix_pv(suffix)
-                pv = ep.PV(pvname, auto_monitor=True, callback=_cb_factory(sig_name))
+            for sig_name, pvname in self._trend_pv_items:
+                # Trend samples only need the value, not DBR_TIME timestamps.
+                pv = ep.PV(pvname, form="native", auto_monitor=True, callback=_cb_factory(sig_name))
                 self._trend_monitor_pvs[sig_name] = pv
             self._trend_use_monitor = True
             self._log("Trend graphs using pyepics monitors (UI throttled)")
@@ -1922,37 +2419,54 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
             self._log(f"Trend monitor setup failed, using polling ({ex})")
 
     def _append_trend_from_cached_monitors(self):
+        # Drain monitor updates queued since the last tick (popleft is safe
+        # against concurrent CA callback appends).
+        batches = {}
+        for key, q in self._trend_monitor_queues.items():
+            items = []
+            while q:
+                items.append(q.popleft())
+            batches[key] = items
         vals = dict(self._trend_monitor_values)
         if all(vals.get(k) is None for k in ("PosAct", "PosSet", "PosErr")):
             # No monitor samples yet, fallback once.
             self._poll_trend_signals()
             return
-        if hasattr(self, "trend_pos_widget"):
-            self.trend_pos_widget.append_point({"PosAct": vals.get("PosAct"), "PosSet": vals.get("PosSet")})
-        if hasattr(self, "trend_err_widget"):
-            self.trend_err_widget.append_point({"PosErr": vals.get("PosErr")})
+        # One row per queued update; signals with fewer updates hold their
+        # latest value so the series stay aligned.
+        n = max(1, max(len(items) for items in batches.values()))
+        rows = []
+        for i in range(n):
+            row = {}
+            for key, items in batches.items():
+                row[key] = items[min(i, len(items) - 1)] if items else vals.get(key)
+            rows.append(row)
+        if self.trend_pos_widget is not None:
+            self.trend_pos_widget.append_points(rows)
+        if self.trend_err_widget is not None:
+            self.trend_err_widget.append_points(rows)
 
     def _poll_trend_signals(self):
-        if not self.motor_record_edit.text().strip():
+        if not self._motor_record_configured:
             return
         vals = {}
-        for key, suffix in (("PosAct", "-PosAct"), ("PosSet", "-PosSet"), ("PosErr", "-PosErr")):
+        for key, pvname in self._trend_pv_items:
             try:
-                vals[key] = float(self.client.get(self._motor_suffix_pv(suffix), as_string=True))
+                vals[key] = float(self.client.get(pvname, as_string=False))
             except Exception:
                 vals[key] = None
-        if hasattr(self, "trend_pos_widget"):
+        if self.trend_pos_widget is not None:
             self.trend_pos_widget.append_point({"PosAct": vals.get("PosAct"), "PosSet": vals.get("PosSet")})
-        if hasattr(self, "trend_err_widget"):
+        if self.trend_err_widget is not None:
             self.trend_err_widget.append_point({"PosErr": vals.get("PosErr")})
 
     def move_to_position(self):
         try:
             self._set_active_motion_mode("move")
-            pos = _to_float(self.move_pos_edit.text(), "Position")
+            pos = _spin_value(self.move_pos_edit)
             velo, accl, accs, vmax = self._shared_motion_params()
             self._set_move_params(velo, accl, accs=accs, vmax=vmax)
-            if hasattr(self, "move_relative_chk") and self.move_relative_chk.isChecked():
+            if self.move_relative_chk is not None and self.move_relative_chk.isChecked():
                 self._put("RLV", pos)
             else:
                 self._put("VAL", pos)
@@ -1987,17 +2501,15 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
     def start_sequence(self):
         try:
             self._set_active_motion_mode("sequence")
-            a = _to_float(self.seq_a_edit.text(), "Pos A")
-            b = _to_float(self.seq_b_edit.text(), "Pos B")
+            a = _spin_value(self.seq_a_edit)
+            b = _spin_value(self.seq_b_edit)
             velo, accl, accs, vmax = self._shared_motion_params()
-            idle_s = _to_float(self.seq_idle_edit.text(), "Idle time")
+            idle_s = _spin_value(self.seq_idle_edit)
             steps = int(float(self.seq_steps_edit.text().strip() or "2"))
-            if idle_s < 0:
-                raise ValueError("Idle time must be >= 0")
             if steps < 1:
                 raise ValueError("Steps must be >= 1")
             if bool(self.seq_relative_chk.isChecked()):
-                rbv = _to_float(self.client.get(self._pv("RBV"), as_string=True), "RBV")
+                rbv = _to_float(self.client.get(self._pv("RBV"), as_string=False), "RBV")
                 a = rbv + a
                 b = rbv + b
             # Step-scan semantics: "steps" is the number of increments (commands)
@@ -2012,12 +2524,11 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
             self._seq_scan_dir = 1
             self._seq_scan_idx = 0
             self._seq_next_target = scan_points[1]
-            self._seq_idle_until = None
+            self._seq_idle_timer.stop()
             self._seq_active = True
             self.seq_state_label.setText("Step 1")
             self._sequence_move_to(scan_points[0])
             self._show_jog_stop_dialog("Sequence (A <-> B)")
-            self._seq_timer.start()
         except Exception as ex:
             self._clear_active_motion_mode()
             self._log(f"Sequence start failed: {ex}")
@@ -2026,13 +2537,44 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
     def _sequence_move_to(self, target):
         p = self._seq_params
         self._set_move_params(p["velo"], p["accl"], accs=p.get("accs"), vmax=p.get("vmax"))
+        # DMOV read or pushed before this point still describes the previous move.
+        self._seq_move_issued_at = time.monotonic()
+        self._seq_seen_moving = False
         self._put("VAL", target)
         self._log(f"Sequence target -> {compact_float_text(target)}")
-        self._refresh_status_if_enabled()
+        if self.auto_refresh_status.isChecked():
+            # Refresh the display only; the next status update decides on DMOV.
+            self._request_status_refresh(advance_sequence=False)
+
+    def _sequence_move_done(self):
+        # True/False once a DMOV from after the VAL put is known, else None.
+        # DMOV=1 only ends the move after a DMOV=0 was seen, so the idle value
+        # from before the put never starts the dwell early.
+        issued = self._seq_move_issued_at
+        if self._status_use_monitor:
+            # Monitors post on change, so a DMOV event after the put is the
+            # motor record reporting this move (DMOV=1 follows its 0).
+            pv = self._pv("DMOV")
+            if self._status_monitor_times.get(pv, 0.0) > issued:
+                dmov = self._status_monitor_values.get(pv)
+                if dmov is not None:
+                    return _truthy_pv(dmov)
+            # No transition pushed for a move that short; trust the value.
+            if time.monotonic() - issued < SEQ_DMOV_GRACE_S:
+                return None
+            dmov = self._status_monitor_values.get(pv)
+            return None if dmov is None else _truthy_pv(dmov)
+        # Polled reads are stamped with their issue time.
+        dmov = self._cached_status_value("DMOV", since=issued)
+        if dmov is None:
+            return None
+        if not _truthy_pv(dmov):
+            self._seq_seen_moving = True
+            return False
+        return self._seq_seen_moving or self._last_status_time - issued >= SEQ_DMOV_GRACE_S
 
     def _sequence_tick(self):
         if not self._seq_active:
-            self._seq_timer.stop()
             return
         try:
             if self._errid_active():
@@ -2045,70 +2587,69 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
                 self.stop_sequence()
                 self.seq_state_label.setText("Stopped on error")
                 return
-            now = time.monotonic()
-            if self._seq_idle_until is not None:
-                remaining = self._seq_idle_until - now
-                if remaining > 0:
-                    self.seq_state_label.setText(f"Idle {remaining:.1f}s")
-                    return
-                pts = list(self._seq_scan_points or [])
-                if len(pts) < 2:
-                    raise RuntimeError("Sequence points unavailable")
-                snake = bool(self._seq_params.get("snake", True))
-                if snake and self._seq_scan_dir >= 0:
+            if self._seq_idle_timer.isActive():
+                # Dwelling; _sequence_advance_target runs when the idle time is over.
+                return
+            if self._sequence_move_done():
+                idle_s = float(self._seq_params.get("idle", 0.0))
+                self.seq_state_label.setText(f"Reached target; idle {idle_s:.1f}s")
+                self._seq_idle_timer.start(max(0, int(round(idle_s * 1000.0))))
+            else:
+                self.seq_state_label.setText("Moving...")
+        except Exception as ex:
+            self._log(f"Sequence error: {ex}")
+            self.stop_sequence()
+
+    def _sequence_advance_target(self):
+        if not self._seq_active:
+            return
+        try:
+            pts = list(self._seq_scan_points or [])
+            if len(pts) < 2:
+                raise RuntimeError("Sequence points unavailable")
+            snake = bool(self._seq_params.get("snake", True))
+            if snake and self._seq_scan_dir >= 0:
+                if self._seq_scan_idx < len(pts) - 1:
+                    self._seq_scan_idx += 1
+                else:
+                    self._seq_scan_dir = -1
+                    self._seq_scan_idx -= 1
+            elif snake and self._seq_scan_dir < 0:
+                if self._seq_scan_idx > 0:
+                    self._seq_scan_idx -= 1
+                else:
+                    self._seq_scan_dir = 1
+                    self._seq_scan_idx += 1
+            else:
+                # Non-snake mode: A->B is stepped, B->A is one direct move.
+                if self._seq_scan_dir >= 0:
                     if self._seq_scan_idx < len(pts) - 1:
                         self._seq_scan_idx += 1
                     else:
                         self._seq_scan_dir = -1
-                        self._seq_scan_idx -= 1
-                elif snake and self._seq_scan_dir < 0:
-                    if self._seq_scan_idx > 0:
-                        self._seq_scan_idx -= 1
-                    else:
-                        self._seq_scan_dir = 1
-                        self._seq_scan_idx += 1
-                else:
-                    # Non-snake mode: A->B is stepped, B->A is one direct move.
-                    if self._seq_scan_dir >= 0:
-                        if self._seq_scan_idx < len(pts) - 1:
-                            self._seq_scan_idx += 1
-                        else:
-                            self._seq_scan_dir = -1
-                            self._seq_scan_idx = 0
-                    else:
-                        self._seq_scan_dir = 1
-                        self._seq_scan_idx = 1 if len(pts) > 1 else 0
-                target = pts[self._seq_scan_idx]
-                self._seq_next_target = target
-                if (not snake) and self._seq_scan_dir < 0 and self._seq_scan_idx == 0:
-                    self.seq_state_label.setText("Return A")
+                        self._seq_scan_idx = 0
                 else:
-                    self.seq_state_label.setText(f"Step {self._seq_scan_idx + 1}")
-                self._seq_idle_until = None
-                self._sequence_move_to(target)
-                return
-
-            dmov = self.client.get(self._pv("DMOV"), as_string=True)
-            if _truthy_pv(dmov):
-                idle_s = float(self._seq_params.get("idle", 0.0))
-                self._seq_idle_until = now + idle_s
-                self.seq_state_label.setText(f"Reached target; idle {idle_s:.1f}s")
-                self._refresh_status_if_enabled()
+                    self._seq_scan_dir = 1
+                    self._seq_scan_idx = 1 if len(pts) > 1 else 0
+            target = pts[self._seq_scan_idx]
+            self._seq_next_target = target
+            if (not snake) and self._seq_scan_dir < 0 and self._seq_scan_idx == 0:
+                self.seq_state_label.setText("Return A")
             else:
-                self.seq_state_label.setText("Moving...")
+                self.seq_state_label.setText(f"Step {self._seq_scan_idx + 1}")
+            self._sequence_move_to(target)
         except Exception as ex:
             self._log(f"Sequence error: {ex}")
             self.stop_sequence()
 
     def stop_sequence(self):
         self._seq_active = False
-        self._seq_idle_until = None
+        self._seq_idle_timer.stop()
         self._seq_next_target = None
         self._seq_params = {}
         self._seq_scan_points = []
         self._seq_scan_dir = 1
         self._seq_scan_idx = 0
-        self._seq_timer.stop()
         self.seq_state_label.setText("Stopped")
         self._local_motion_started = False
         self._clear_active_motion_mode()
@@ -2159,27 +2700,16 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
     def stop_motion(self):
         # Also stop local sequence state, if active.
         self._seq_active = False
-        self._seq_idle_until = None
-        self._seq_timer.stop()
+        self._seq_idle_timer.stop()
         self.seq_state_label.setText("Stopped")
         self._clear_active_motion_mode()
         self._close_jog_stop_dialog()
         try:
-            try:
-                self._put("JOGF", 0, quiet=True)
-            except Exception:
-                pass
-            try:
-                self._put("JOGR", 0, quiet=True)
-            except Exception:
-                pass
-            stop_ok = False
-            try:
-                self._put("STOP", 1)
-                stop_ok = True
-            except Exception as ex:
-                self._log(f"STOP field failed ({ex}), trying SPMG=0")
+            # Jog resets and STOP go out in one flush.
+            errors = self._put_many([("JOGF", 0), ("JOGR", 0), ("STOP", 1)], quiet_fields={"JOGF", "JOGR"})
+            stop_ok = "STOP" not in errors
             if not stop_ok:
+                self._log(f"STOP field failed ({errors['STOP']}), trying SPMG=0")
                 try:
                     # 0=Stop in standard motor record SPMG menu
                     self._put("SPMG", 0)
@@ -2196,25 +2726,17 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
     def kill_motion(self):
         # KILL means disable controller/drive via motor record field CNEN=0.
         self._seq_active = False
-        self._seq_idle_until = None
-        self._seq_timer.stop()
+        self._seq_idle_timer.stop()
         self.seq_state_label.setText("Stopped")
         self._clear_active_motion_mode()
         self._close_jog_stop_dialog()
         try:
-            try:
-                self._put("JOGF", 0, quiet=True)
-            except Exception:
-                pass
-            try:
-                self._put("JOGR", 0, quiet=True)
-            except Exception:
-                pass
-            try:
-                self._put("STOP", 1, quiet=True)
-            except Exception:
-                pass
-            self._put("CNEN", 0)
+            errors = self._put_many(
+                [("JOGF", 0), ("JOGR", 0), ("STOP", 1), ("CNEN", 0)],
+                quiet_fields={"JOGF", "JOGR", "STOP"},
+            )
+            if "CNEN" in errors:
+                raise errors["CNEN"]
             self._log("KILL requested (CNEN=0)")
             self._refresh_status_if_enabled()
         except Exception as ex:
@@ -2234,6 +2756,14 @@ class MotionWindow(_MotionPvMixin, QtWidgets.QMainWindow):
                 self._close_jog_stop_dialog()
             except Exception:
                 pass
+            try:
+                self._status_timer.stop()
+                self._status_monitor_holdoff.stop()
+                self._clear_status_monitors()
+                self._status_thread.quit()
+                self._status_thread.wait(int(float(self.client.timeout) * 1000) + 500)
+            except Exception:
+                pass
             super().closeEvent(event)
 
 
@@ -1,27 +1,50 @@
 #!/usr/bin/env python3
 import argparse
+import hashlib
 import json
+import math
+import os
 import re
 import shutil
 import subprocess
 import sys
-from datetime import datetime
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, deque
 from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 
 from qt_compat import QtCore, QtGui, QtWidgets
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+Signal = getattr(QtCore, 'pyqtSignal', None)
+if Signal is None:
+    Signal = getattr(QtCore, 'Signal')
+Slot = getattr(QtCore, 'pyqtSlot', None)
+if Slot is None:
+    Slot = getattr(QtCore, 'Slot')
+
 
 PLACEHOLDER_RE = re.compile(r'<([^>]+)>')
 FLOAT_LITERAL_RE = re.compile(r'(?<![A-Za-z0-9_])([+-]?(?:(?:\d+\.\d*)|(?:\.\d+))(?:[eE][+-]?\d+)?)(?![A-Za-z0-9_])')
 FLOAT_DISPLAY_RE = re.compile(r'^[+-]?(?:(?:\d+\.\d*)|(?:\.\d+)|(?:\d+(?:\.\d*)?[eE][+-]?\d+)|(?:\.\d+[eE][+-]?\d+))$')
+# str.translate table deleting every character a float display string can contain.
+_NON_FLOAT_DISPLAY_CHARS = str.maketrans('', '', '0123456789+-.,eE')
 FLOAT_DISPLAY_COMMA_RE = re.compile(r'^[+-]?(?:(?:\d+,\d*)|(?:,\d+)|(?:\d+(?:,\d*)?[eE][+-]?\d+)|(?:,\d+[eE][+-]?\d+))$')
 QRY_ERROR_PREFIX_RE = re.compile(
     r'^(?:error|err\b|failed|fail\b|invalid|unknown\b|exception|timeout|denied|blocked|'
     r'not\s+allowed|cancel(?:ed|led)\b)'
 )
 ERROR_CODE_RE = re.compile(r'Error:\s*([A-Za-z0-9_.+-]+)', flags=re.IGNORECASE)
+IOC_PREFIX_RE = re.compile(r'^(.*):MCU-Cmd\.AOUT$')
 LOCAL_ERROR_DB_NAME = 'ecmc_error_codes.json'
+# Catalog fields whose values repeat across many commands.
+_SHARED_CATALOG_FIELDS = ('category', 'runtime_class', 'runtime_note', 'header_source', 'parser_source')
 APP_LAUNCH_PLACEHOLDER = 'Open app...'
 APP_LAUNCH_STREAM = 'New Stream App'
 APP_LAUNCH_AXIS = 'Axis Cfg App'
@@ -40,9 +63,14 @@ class EpicsClient:
         self._epics = None
         self._epicspv_mod = None
         self._epicspv_cache = {}
-        self._caput_bin = shutil.which('caput')
-        self._caget_bin = shutil.which('caget')
-        self._cli_available = bool(self._caput_bin and self._caget_bin)
+        self._pv_objects = {}
+        self._pv_ctrl = {}
+        # caget/caput are looked up on PATH only if the CLI backend is needed.
+        self._caput_bin = None
+        self._caget_bin = None
+        self._cli_probed = False
+        # None until known whether this caget accepts -noname/-nostat/-nounit.
+        self._cli_caget_value_flags = None
 
         try:
             import epicsPV  # type: ignore
@@ -51,26 +79,36 @@ class EpicsClient:
         except Exception:
             self._epicspv_mod = None
 
-        try:
-            import epics  # type: ignore
-
-            self._epics = epics
-        except Exception:
-            self._epics = None
-
         if self._epicspv_mod is not None:
+            # pyepics is only imported if epicsPV later turns out unusable.
             self.backend = 'epicsPV'
             return
+        self._epics = self._import_pyepics()
         if self._epics is not None:
             self.backend = 'pyepics'
             return
 
-        if self._cli_available:
+        if self._cli_available():
             self.backend = 'cli'
             return
 
         raise RuntimeError('No EPICS client available. Install pyepics or ensure caget/caput are in PATH.')
 
+    def _import_pyepics(self):
+        try:
+            import epics  # type: ignore
+
+            return epics
+        except Exception:
+            return None
+
+    def _cli_available(self):
+        if not self._cli_probed:
+            self._caput_bin = shutil.which('caput')
+            self._caget_bin = shutil.which('caget')
+            self._cli_probed = True
+        return bool(self._caput_bin and self._caget_bin)
+
     def _is_missing_ca_dll_error(self, ex):
         msg = str(ex).lower()
         return ('cannot find epics ca dll' in msg) or ('cannot load ca dll' in msg)
@@ -83,15 +121,18 @@ class EpicsClient:
         if self.backend == 'epicsPV':
             self._epicspv_mod = None
             self._epicspv_cache = {}
+            if self._epics is None:
+                self._epics = self._import_pyepics()
             if self._epics is not None:
                 self.backend = 'pyepics'
                 return True
 
-        if self._cli_available:
+        if self._cli_available():
             self.backend = 'cli'
             self._epics = None
             self._epicspv_mod = None
             self._epicspv_cache = {}
+            self._pv_objects = {}
             return True
         return False
 
@@ -108,6 +149,59 @@ class EpicsClient:
         self._epicspv_cache[pv] = obj
         return obj
 
+    def pv(self, pv):
+        """Return a cached pyepics PV object, created on first use."""
+        name = str(pv)
+        obj = self._pv_objects.get(name)
+        if obj is None:
+            # form='native' requests plain DBR values; callers never use the
+            # timestamp/alarm fields carried by the default DBR_TIME types.
+            obj = self._epics.PV(name, form='native', auto_monitor=False, connection_timeout=self.timeout)
+            self._pv_objects[name] = obj
+        return obj
+
+    def prewarm(self, pvs, wait=0.0):
+        # Start channel searches up front so the first get/put does not wait
+        # for each connection in turn. Optionally wait (bounded in total) for
+        # the searches, which run in parallel.
+        if self.backend != 'pyepics':
+            return
+        objs = []
+        for pv in pvs:
+            try:
+                objs.append(self.pv(pv))
+            except Exception:
+                pass
+        deadline = time.monotonic() + max(0.0, float(wait))
+        for obj in objs:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                obj.wait_for_connection(timeout=remaining)
+            except Exception:
+                pass
+
+    def monitor(self, pv, callback, form='native', connection_callback=None):
+        """Subscribe to value updates; returns the PV object, or None when the
+        backend cannot monitor (callers should keep polling)."""
+        if self.backend != 'pyepics' or self._epics is None:
+            return None
+        kwargs = {'form': form, 'auto_monitor': True, 'callback': callback}
+        if connection_callback is not None:
+            kwargs['connection_callback'] = connection_callback
+        return self._epics.PV(str(pv), **kwargs)
+
+    def clear_monitor(self, obj):
+        try:
+            obj.clear_callbacks()
+        except Exception:
+            pass
+        try:
+            obj.disconnect()
+        except Exception:
+            pass
+
     def _parse_cli_caget_value(self, pv, raw_out):
         s = str(raw_out or '').strip()
         if not s:
@@ -168,7 +262,7 @@ class EpicsClient:
 
         if self.backend == 'pyepics':
             try:
-                ok = self._epics.caput(pv, value, wait=wait, timeout=self.timeout)
+                ok = self.pv(pv).put(value, wait=wait, timeout=self.timeout)
                 if ok is None:
                     raise RuntimeError(f'caput failed for {pv}')
                 return
@@ -193,6 +287,36 @@ class EpicsClient:
         if proc.returncode != 0:
             raise RuntimeError(proc.stderr.strip() or proc.stdout.strip() or f'caput failed for {pv}')
 
+    def put_many(self, items, wait=False):
+        """Write several (pv, value) pairs and return [(pv, error), ...] for failures."""
+        items = [(str(pv), value) for pv, value in items]
+        failed = []
+        if self.backend == 'pyepics':
+            try:
+                # Queue all puts on connected channels and flush once at the end.
+                for pv, value in items:
+                    try:
+                        ok = self.pv(pv).put(value, wait=wait, timeout=self.timeout)
+                        if ok is None:
+                            raise RuntimeError(f'caput failed for {pv}')
+                    except Exception as ex:
+                        if self._is_missing_ca_dll_error(ex):
+                            raise
+                        failed.append((pv, ex))
+                self._epics.ca.flush_io()
+                return failed
+            except Exception as ex:
+                if self._fallback_if_backend_unavailable(ex):
+                    return self.put_many(items, wait=wait)
+                raise
+
+        for pv, value in items:
+            try:
+                self.put(pv, value, wait=wait)
+            except Exception as ex:
+                failed.append((pv, ex))
+        return failed
+
     def get(self, pv, as_string=True):
         if self.backend == 'epicsPV':
             try:
@@ -200,7 +324,7 @@ class EpicsClient:
                 val = obj.getw()
                 if val is None:
                     raise RuntimeError(f'caget failed for {pv}')
-                return str(val)
+                return str(val) if as_string else val
             except Exception as ex:
                 if self._fallback_if_backend_unavailable(ex):
                     return self.get(pv, as_string=as_string)
@@ -208,50 +332,143 @@ class EpicsClient:
 
         if self.backend == 'pyepics':
             try:
-                val = self._epics.caget(pv, as_string=as_string, timeout=self.timeout)
+                val = self.pv(pv).get(as_string=as_string, timeout=self.timeout)
                 if val is None:
                     raise RuntimeError(f'caget failed for {pv}')
-                return str(val)
+                # as_string=False returns the native CA value (CLI always returns text).
+                return str(val) if as_string else val
             except Exception as ex:
                 if self._fallback_if_backend_unavailable(ex):
                     return self.get(pv, as_string=as_string)
                 raise
 
-        # Prefer a clean value-only output to avoid PV/alarm text mixing
-        # into application-level parsing (e.g. axis object-id discovery).
-        cmd = [str(self._caget_bin or 'caget'), '-t', '-w', str(float(self.timeout)), '-noname', '-nostat', '-nounit', pv]
-        proc = subprocess.run(
-            cmd,
-            universal_newlines=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
+        proc = self._cli_caget([pv])
         if proc.returncode != 0:
-            # Some caget variants may not support all formatting flags.
-            # Fallback to plain terse mode and parse best-effort.
+            raise RuntimeError(proc.stderr.strip() or proc.stdout.strip() or f'caget failed for {pv}')
+        return self._parse_cli_caget_value(pv, proc.stdout)
+
+    def _cli_caget(self, pvs):
+        base = [str(self._caget_bin or 'caget'), '-t', '-w', str(float(self.timeout))]
+        if self._cli_caget_value_flags is not False:
+            # Prefer a clean value-only output to avoid PV/alarm text mixing
+            # into application-level parsing (e.g. axis object-id discovery).
             proc = subprocess.run(
-                [str(self._caget_bin or 'caget'), '-t', '-w', str(float(self.timeout)), pv],
+                base + ['-noname', '-nostat', '-nounit'] + list(pvs),
                 universal_newlines=True,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
             )
-        if proc.returncode != 0:
-            raise RuntimeError(proc.stderr.strip() or proc.stdout.strip() or f'caget failed for {pv}')
-        return self._parse_cli_caget_value(pv, proc.stdout)
+            if proc.returncode == 0:
+                self._cli_caget_value_flags = True
+            if proc.returncode == 0 or self._cli_caget_value_flags:
+                return proc
+        # Some caget variants may not support all formatting flags.
+        # Fallback to plain terse mode and parse best-effort; once that works
+        # the flags are skipped, saving a caget process per read.
+        proc = subprocess.run(
+            base + list(pvs),
+            universal_newlines=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        if proc.returncode == 0 and self._cli_caget_value_flags is None:
+            self._cli_caget_value_flags = False
+        return proc
+
+    def _pyepics_char_value(self, obj, val):
+        # Same text form as PV.get(as_string=True): enum labels and PREC
+        # formatted floats, plain str() for everything else.
+        dbr = self._epics.dbr
+        ntype = self._epics.ca.native_type(obj.ftype)
+        if ntype not in (dbr.ENUM, dbr.FLOAT, dbr.DOUBLE):
+            return str(val)
+        ctrl = self._pv_ctrl.get(obj.pvname)
+        if ctrl is None:
+            ctrl = obj.get_ctrlvars(timeout=self.timeout) or {}
+            self._pv_ctrl[obj.pvname] = ctrl
+        if ntype == dbr.ENUM:
+            strs = ctrl.get('enum_strs') or ()
+            try:
+                return str(strs[int(val)])
+            except Exception:
+                return str(val)
+        try:
+            prec = ctrl.get('precision')
+            fmt = '%%.%if'
+            if 4 < abs(int(math.log10(abs(val + 1.e-9)))):
+                fmt = '%%.%ig'
+            return (fmt % prec) % val
+        except (ValueError, TypeError, ArithmeticError):
+            return str(val)
+
+    def get_many(self, pvs, as_string=True):
+        """Read several PVs; returns {pv: value} with an exception as value for failed reads."""
+        names = [str(pv) for pv in pvs]
+        out = {}
+        if self.backend == 'pyepics':
+            try:
+                ca = self._epics.ca
+                deadline = time.monotonic() + float(self.timeout)
+                pending = []
+                # Issue all reads first, then collect: one round trip instead of one per PV.
+                for name in names:
+                    try:
+                        obj = self.pv(name)
+                        if not obj.wait_for_connection(timeout=max(0.0, deadline - time.monotonic())):
+                            raise RuntimeError(f'caget failed for {name}')
+                        if obj.count > 1:
+                            out[name] = self.get(name, as_string=as_string)
+                            continue
+                        ca.get(obj.chid, ftype=obj.ftype, wait=False)
+                        pending.append((name, obj))
+                    except Exception as ex:
+                        if self._is_missing_ca_dll_error(ex):
+                            raise
+                        out[name] = ex
+                for name, obj in pending:
+                    try:
+                        val = ca.get_complete(obj.chid, ftype=obj.ftype, timeout=self.timeout)
+                        if val is None:
+                            raise RuntimeError(f'caget failed for {name}')
+                        out[name] = self._pyepics_char_value(obj, val) if as_string else val
+                    except Exception as ex:
+                        out[name] = ex
+                return out
+            except Exception as ex:
+                if self._fallback_if_backend_unavailable(ex):
+                    return self.get_many(names, as_string=as_string)
+                raise
+
+        if self.backend == 'cli' and len(names) > 1:
+            # One caget process for all PVs (terse output: one line per PV, in
+            # order). Any failure falls back to per-PV reads for per-PV errors.
+            proc = self._cli_caget(names)
+            lines = proc.stdout.splitlines() if proc.returncode == 0 else []
+            if len(lines) == len(names):
+                return {name: self._parse_cli_caget_value(name, line) for name, line in zip(names, lines)}
+
+        for name in names:
+            try:
+                out[name] = self.get(name, as_string=as_string)
+            except Exception as ex:
+                out[name] = ex
+        return out
+
+
+@lru_cache(maxsize=4096)
+def _template_placeholders(template):
+    # (unique names in order, all names incl. duplicates) per template string;
+    # the editor rows re-ask for the same templates on every preview update.
+    all_names = tuple(PLACEHOLDER_RE.findall(template))
+    return tuple(dict.fromkeys(all_names)), all_names
 
 
 def placeholders_in_template(template):
-    names = []
-    seen = set()
-    for n in PLACEHOLDER_RE.findall(template or ''):
-        if n not in seen:
-            seen.add(n)
-            names.append(n)
-    return names
+    return list(_template_placeholders(str(template or ''))[0])
 
 
 def placeholders_in_template_all(template):
-    return PLACEHOLDER_RE.findall(template or '')
+    return list(_template_placeholders(str(template or ''))[1])
 
 
 def placeholders_in_parser_signature(parser_sig):
@@ -260,45 +477,99 @@ def placeholders_in_parser_signature(parser_sig):
     return placeholders_in_template_all(parser_sig or '')
 
 
+@lru_cache(maxsize=4096)
+def _param_types_for(template, parser_sig):
+    # Parser type per unique template placeholder, by position ('' if the
+    # signature has fewer entries). Catalog commands share signatures.
+    names = _template_placeholders(template)[0]
+    types = _template_placeholders(parser_sig)[1]
+    return tuple(types[i] if i < len(types) else '' for i in range(len(names)))
+
+
+@lru_cache(maxsize=4096)
+def _template_parts(template):
+    # Literal text and placeholder names alternate: [lit, name, lit, ..., lit].
+    return tuple(PLACEHOLDER_RE.split(template))
+
+
+class _PlaceholderValues(dict):
+    def __missing__(self, key):
+        return f'<{key}>'
+
+
+@lru_cache(maxsize=4096)
+def _format_template(template):
+    # str.format form of a template ("<a>" -> "{a}", literal braces doubled),
+    # or None when a placeholder name is not a plain identifier and would be
+    # read as a format field expression.
+    parts = _template_parts(template)
+    out = []
+    for i, part in enumerate(parts):
+        if i % 2:
+            if not part.isidentifier():
+                return None
+            out.append('{' + part + '}')
+        else:
+            out.append(part.replace('{', '{{').replace('}', '}}'))
+    return ''.join(out)
+
+
 def fill_template(template, values):
-    out = str(template or '')
-    for name in placeholders_in_template(out):
+    # Single pass over the template; a filled-in value is never rescanned, so
+    # values containing "<...>" are left alone.
+    template = str(template or '')
+    if '<' not in template:
+        return template
+    fmt = _format_template(template)
+    if fmt is not None:
+        filled = _PlaceholderValues()
+        for name, v in values.items():
+            v = v.strip()
+            if v:
+                filled[name] = v
+        return fmt.format_map(filled)
+    parts = _template_parts(template)
+    out = list(parts)
+    for i in range(1, len(out), 2):
+        name = out[i]
         v = values.get(name, '').strip()
-        out = out.replace(f'<{name}>', v if v else f'<{name}>')
-    return out
+        out[i] = v if v else f'<{name}>'
+    return ''.join(out)
 
 
 def _join_prefix_pv(prefix, suffix):
-    p = str(prefix or '').strip()
-    s = str(suffix or '').strip()
+    # Callers nearly always pass str; only coerce other types (None etc.).
+    p = prefix.strip() if type(prefix) is str else str(prefix or '').strip()
+    s = suffix.strip() if type(suffix) is str else str(suffix or '').strip()
     if not p:
         return s
-    if p.endswith(':'):
-        return f'{p}{s}'
+    if p[-1] == ':':
+        return p + s
     return f'{p}:{s}'
 
 
+@lru_cache(maxsize=256)
 def _proc_pv_for_readback(pv):
+    # Called on every query with the same few QRY PV names.
     p = str(pv or '').strip()
     if not p:
         return ''
-    if '.' in p:
-        return f"{p.split('.', 1)[0]}.PROC"
-    return f'{p}.PROC'
+    i = p.find('.')
+    return f'{p if i < 0 else p[:i]}.PROC'
 
 
+@lru_cache(maxsize=8192)
 def _trim_float_literal_zeros(token):
+    # Commands repeat the same literals, so results are memoized per token.
     t = str(token or '').strip()
-    if not t:
+    if '.' not in t:
         return t
     exp = ''
     base = t
-    for sep in ('e', 'E'):
-        if sep in base:
-            i = base.find(sep)
-            exp = base[i:]
-            base = base[:i]
-            break
+    i = t.lower().find('e')
+    if i >= 0:
+        exp = base[i:]
+        base = base[:i]
 
     sign = ''
     if base[:1] in '+-':
@@ -322,10 +593,43 @@ def _trim_float_literal_zeros(token):
 
 def normalize_float_literals(cmd):
     s = str(cmd or '')
-    return FLOAT_LITERAL_RE.sub(lambda m: _trim_float_literal_zeros(m.group(1)), s)
+    # Every float literal contains a '.', so most commands need no scan at all.
+    if '.' not in s:
+        return s
+    return _normalize_dotted_command(s)
+
+
+@lru_cache(maxsize=1024)
+def _normalize_dotted_command(s):
+    # Send paths normalize the same command text more than once (blocklist
+    # check, then the put), so the regex scan is memoized.
+    out = []
+    last = 0
+    for m in FLOAT_LITERAL_RE.finditer(s):
+        start, end = m.span(1)
+        out.append(s[last:start])
+        out.append(_trim_float_literal_zeros(m.group(1)))
+        last = end
+    if not out:
+        return s
+    out.append(s[last:])
+    return ''.join(out)
 
 
 def compact_float_text(value, sig_digits=15):
+    # Polled values repeat a lot while idle; memoize hashable inputs.
+    try:
+        return _compact_float_text_cached(value, sig_digits)
+    except TypeError:
+        return _compact_float_text(value, sig_digits)
+
+
+@lru_cache(maxsize=1024, typed=True)
+def _compact_float_text_cached(value, sig_digits):
+    return _compact_float_text(value, sig_digits)
+
+
+def _compact_float_text(value, sig_digits=15):
     if isinstance(value, bool):
         return str(value)
     if isinstance(value, int):
@@ -337,6 +641,10 @@ def compact_float_text(value, sig_digits=15):
         s = str(value or '').strip()
         if not s:
             return s
+        # Cheap rejects before the regexes: text with characters that cannot
+        # appear in a float, and plain digit strings (never reformatted).
+        if s.isdigit() or s.translate(_NON_FLOAT_DISPLAY_CHARS):
+            return str(value)
         if FLOAT_DISPLAY_COMMA_RE.match(s) and '.' not in s:
             s = s.replace(',', '.')
         if not FLOAT_DISPLAY_RE.match(s):
@@ -395,6 +703,37 @@ def parse_error_code(code_text):
         return None
 
 
+def _file_fingerprint(p):
+    try:
+        st = p.stat()
+    except OSError:
+        return (str(p), None, None)
+    return (str(p.resolve()), st.st_mtime_ns, st.st_size)
+
+
+def _user_cache_dir():
+    # Per-user cache directory (XDG), created private. None when it cannot be
+    # trusted: owned by someone else or writable by group/others.
+    base = os.environ.get('XDG_CACHE_HOME') or str(Path.home() / '.cache')
+    d = Path(base) / 'ecmc_cfg_tool'
+    try:
+        d.mkdir(mode=0o700, parents=True, exist_ok=True)
+        st = d.stat()
+        if hasattr(os, 'getuid') and (st.st_uid != os.getuid() or st.st_mode & 0o022):
+            return None
+    except OSError:
+        return None
+    return d
+
+
+def _read_json_file(p):
+    # Parse straight from bytes; orjson is used when installed.
+    if orjson is not None:
+        return orjson.loads(p.read_bytes())
+    with p.open('rb') as f:
+        return json.load(f)
+
+
 @lru_cache(maxsize=8)
 def load_local_error_name_map(db_path=''):
     base_dir = Path(__file__).resolve().parent
@@ -402,7 +741,7 @@ def load_local_error_name_map(db_path=''):
     if not p.exists():
         return {}
     try:
-        data = json.loads(p.read_text())
+        data = _read_json_file(p)
     except Exception:
         return {}
     items = data.get('errors', []) if isinstance(data, dict) else []
@@ -440,6 +779,56 @@ class CompactDoubleSpinBox(QtWidgets.QDoubleSpinBox):
         return compact_float_text(value)
 
 
+_PARAM_NUM_HINT_RE = re.compile(
+    '|'.join(
+        (
+            'index', 'idx', 'id', 'axis', 'slave', 'master', 'enable',
+            'value', 'vel', 'acc', 'dec', 'time', 'timeout', 'size',
+            'count', 'bit', 'mask', 'offset', 'mode', 'cmd', 'pos',
+        )
+    )
+)
+_PARAM_TEXT_HINT_RE = re.compile('name|file|path|expr|string|cfg')
+
+
+@lru_cache(maxsize=1024)
+def _param_name_looks_numeric(name):
+    # Catalog commands reuse a small set of parameter names across rows.
+    n = str(name or '').lower()
+    return bool(_PARAM_NUM_HINT_RE.search(n)) and not _PARAM_TEXT_HINT_RE.search(n)
+
+
+@lru_cache(maxsize=1024)
+def _param_widget_kind(ptype, name):
+    # Editor kind for a multi-command parameter: 'int', 'uint', 'hex', 'float'
+    # or 'text'. Untyped parameters fall back to the name hints.
+    t = (ptype or '').lower()
+    if t in {'hex', 'hex64'}:
+        return 'hex'
+    if t in {'uint', 'u64'}:
+        return 'uint'
+    if t in {'int', 'i64', 'char'}:
+        return 'int'
+    if t in {'float', 'double'} or _param_name_looks_numeric(name):
+        return 'float'
+    return 'text'
+
+
+_SPIN_ARROW_BTN_QSS = (
+    'QPushButton {'
+    ' background: #6a6a6a;'
+    ' color: #ffffff;'
+    ' border: 1px solid #4c4c4c;'
+    ' border-radius: 2px;'
+    ' padding: 0px;'
+    ' font-size: 10px;'
+    ' font-weight: 700;'
+    '}'
+    'QPushButton:pressed { background: #4f4f4f; }'
+)
+_PARAM_SPACER_QSS = 'QLineEdit { background: #f4f4f4; color: #f4f4f4; border: 1px solid #eee; }'
+
+
 class SpinBoxWithButtons(QtWidgets.QWidget):
     def __init__(self, float_mode=False):
         super().__init__()
@@ -476,20 +865,8 @@ class SpinBoxWithButtons(QtWidgets.QWidget):
         self.down_btn.setFocusPolicy(QtCore.Qt.NoFocus)
         self.up_btn.setCursor(QtCore.Qt.ArrowCursor)
         self.down_btn.setCursor(QtCore.Qt.ArrowCursor)
-        arrow_btn_style = (
-            'QPushButton {'
-            ' background: #6a6a6a;'
-            ' color: #ffffff;'
-            ' border: 1px solid #4c4c4c;'
-            ' border-radius: 2px;'
-            ' padding: 0px;'
-            ' font-size: 10px;'
-            ' font-weight: 700;'
-            '}'
-            'QPushButton:pressed { background: #4f4f4f; }'
-        )
-        self.up_btn.setStyleSheet(arrow_btn_style)
-        self.down_btn.setStyleSheet(arrow_btn_style)
+        # One style sheet on the column covers both arrow buttons.
+        btn_col.setStyleSheet(_SPIN_ARROW_BTN_QSS)
         self.up_btn.clicked.connect(self.spin.stepUp)
         self.down_btn.clicked.connect(self.spin.stepDown)
         btn_col_l.addWidget(self.up_btn)
@@ -529,7 +906,6 @@ class ParamInputWidget(QtWidgets.QWidget):
         super().__init__()
         self.name = name
         self.ptype = (ptype or '').lower()
-        self._updating = False
         self._build_ui()
 
     def _build_ui(self):
@@ -576,56 +952,50 @@ class ParamInputWidget(QtWidgets.QWidget):
             self.slider.valueChanged.connect(self._slider_to_spin)
             self.edit.editingFinished.connect(self._text_to_spin)
 
-    def _slider_to_spin(self, val):
-        if self._updating or self.spin is None:
+    def _set_quietly(self, widget, value):
+        # Block the target's own signals so spin/slider/text syncing does not
+        # bounce back through the other handlers.
+        if widget is None:
             return
-        self._updating = True
+        blocked = widget.blockSignals(True)
         try:
-            if isinstance(self.spin, QtWidgets.QDoubleSpinBox):
-                self.spin.setValue(val / 10.0)
-            else:
-                self.spin.setValue(val)
+            widget.setValue(value)
         finally:
-            self._updating = False
+            widget.blockSignals(blocked)
 
-    def _spin_to_text(self, val):
-        if self._updating:
+    def _slider_to_spin(self, val):
+        if self.spin is None:
             return
-        self._updating = True
-        try:
-            if isinstance(self.spin, QtWidgets.QDoubleSpinBox):
-                self.edit.setText(compact_float_text(val))
-                if self.slider is not None:
-                    self.slider.setValue(int(round(float(val) * 10.0)))
-            else:
-                self.edit.setText(str(int(val)))
-                if self.slider is not None:
-                    self.slider.setValue(int(val))
-        finally:
-            self._updating = False
+        if isinstance(self.spin, QtWidgets.QDoubleSpinBox):
+            self._set_quietly(self.spin, val / 10.0)
+        else:
+            self._set_quietly(self.spin, val)
+
+    def _spin_to_text(self, val):
+        if isinstance(self.spin, QtWidgets.QDoubleSpinBox):
+            self.edit.setText(compact_float_text(val))
+            self._set_quietly(self.slider, int(round(float(val) * 10.0)))
+        else:
+            self.edit.setText(str(int(val)))
+            self._set_quietly(self.slider, int(val))
 
     def _text_to_spin(self):
-        if self._updating or self.spin is None:
+        if self.spin is None:
             return
         t = self.edit.text().strip()
         if not t:
             return
-        self._updating = True
         try:
             if isinstance(self.spin, QtWidgets.QDoubleSpinBox):
                 v = float(t)
-                self.spin.setValue(v)
-                if self.slider is not None:
-                    self.slider.setValue(int(round(v * 10.0)))
+                self._set_quietly(self.spin, v)
+                self._set_quietly(self.slider, int(round(v * 10.0)))
             else:
                 v = int(float(t))
-                self.spin.setValue(v)
-                if self.slider is not None:
-                    self.slider.setValue(v)
+                self._set_quietly(self.spin, v)
+                self._set_quietly(self.slider, v)
         except Exception:
             pass
-        finally:
-            self._updating = False
 
     def text(self):
         return self.edit.text()
@@ -646,12 +1016,14 @@ class CommandEditorRow(QtWidgets.QGroupBox):
         self.command_data = command_data
         self.template = command_data.get('command_named', command_data.get('command', ''))
         self.param_names = placeholders_in_template(self.template)
-        parser_placeholders = placeholders_in_parser_signature(command_data.get('parser_command', ''))
-        self.param_types = {}
-        for i, name in enumerate(self.param_names):
-            t = parser_placeholders[i] if i < len(parser_placeholders) else ''
-            self.param_types[name] = t
+        types = _param_types_for(str(self.template or ''), str(command_data.get('parser_command', '') or ''))
+        self.param_types = dict(zip(self.param_names, types))
         self.param_widgets = {}
+        # Keystroke bursts re-render the preview once.
+        self._preview_timer = QtCore.QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(50)
+        self._preview_timer.timeout.connect(self._update_preview)
         self._build_ui()
         self._update_preview()
 
@@ -675,28 +1047,9 @@ class CommandEditorRow(QtWidgets.QGroupBox):
         toggle_row.addStretch(1)
         layout.addLayout(toggle_row)
 
+        # The parameter editors are built on first use (_ensure_param_widgets).
         self.params_widget = QtWidgets.QWidget()
         self.params_widget.setVisible(False)
-        if self.param_names:
-            grid = QtWidgets.QGridLayout(self.params_widget)
-            grid.setContentsMargins(0, 0, 0, 0)
-            grid.setHorizontalSpacing(8)
-            grid.setVerticalSpacing(4)
-            cols = 2
-            for p in self.param_names:
-                w = ParamInputWidget(p, self.param_types.get(p, ''))
-                w.edit.textChanged.connect(self._update_preview)
-                self.param_widgets[p] = w
-            for i, p in enumerate(self.param_names):
-                r = i // cols
-                c = i % cols
-                cell = QtWidgets.QWidget()
-                cell_l = QtWidgets.QVBoxLayout(cell)
-                cell_l.setContentsMargins(0, 0, 0, 0)
-                cell_l.setSpacing(2)
-                cell_l.addWidget(QtWidgets.QLabel(p))
-                cell_l.addWidget(self.param_widgets[p])
-                grid.addWidget(cell, r, c)
         layout.addWidget(self.params_widget)
 
         self.preview = QtWidgets.QLineEdit('')
@@ -722,7 +1075,30 @@ class CommandEditorRow(QtWidgets.QGroupBox):
         self.result.setWordWrap(True)
         layout.addWidget(self.result)
 
+    def _ensure_param_widgets(self):
+        if self.param_widgets or not self.param_names:
+            return
+        grid = QtWidgets.QGridLayout(self.params_widget)
+        grid.setContentsMargins(0, 0, 0, 0)
+        grid.setHorizontalSpacing(8)
+        grid.setVerticalSpacing(4)
+        cols = 2
+        for p in self.param_names:
+            w = ParamInputWidget(p, self.param_types.get(p, ''))
+            w.edit.textChanged.connect(lambda _text: self._preview_timer.start())
+            self.param_widgets[p] = w
+        for i, p in enumerate(self.param_names):
+            # Label above its editor directly in the grid (two grid rows per
+            # parameter row), without a wrapper widget and layout per cell.
+            r = 2 * (i // cols)
+            c = i % cols
+            grid.addWidget(QtWidgets.QLabel(p), r, c)
+            grid.addWidget(self.param_widgets[p], r + 1, c)
+        self._update_preview()
+
     def _toggle_params(self, checked):
+        if checked:
+            self._ensure_param_widgets()
         self.params_widget.setVisible(bool(checked))
 
     def _values(self):
@@ -735,6 +1111,7 @@ class CommandEditorRow(QtWidgets.QGroupBox):
         self.preview.setText(self.command_text())
 
     def _fill_zeroes(self):
+        self._ensure_param_widgets()
         for w in self.param_widgets.values():
             if not w.text().strip():
                 w.set_text('0')
@@ -744,13 +1121,17 @@ class CommandEditorRow(QtWidgets.QGroupBox):
         self.parent_window._log('Copied multi-command row preview to clipboard')
 
     def _write_command(self):
-        cmd = self.command_text().strip()
-        ok, msg = self.parent_window.read_raw_command(cmd)
-        self.result.setText(compact_query_message_value(msg))
+        self._send_command()
 
     def _read_command(self):
+        self._send_command()
+
+    def _send_command(self):
         cmd = self.command_text().strip()
-        ok, msg = self.parent_window.read_raw_command(cmd)
+        self.result.setText('Busy...')
+        self.parent_window.read_raw_command_async(cmd, self._show_result)
+
+    def _show_result(self, _ok, msg):
         self.result.setText(compact_query_message_value(msg))
 
 
@@ -759,7 +1140,32 @@ class MultiCommandDialog(QtWidgets.QDialog):
         super().__init__(parent_window)
         self.parent_window = parent_window
         self.commands = commands
-        self.rows = []
+        # Per-row data as parallel lists indexed by row (the "Set all" row
+        # excluded): split template, placeholder slots, editors, result label.
+        self._row_parts = []
+        self._row_slots = []
+        self._row_widget_lists = []
+        self._row_results = []
+        # "Set all" spin changes are applied to the rows in one batch; the
+        # applied values are kept for rows created by later batches.
+        self._pending_broadcast = {}
+        self._broadcast_values = {}
+        # Act on every row, so they stay disabled until the last row batch.
+        self._set_all_widget = None
+        self._write_all_btn = None
+        self._read_all_btn = None
+        self._broadcast_timer = QtCore.QTimer(self)
+        self._broadcast_timer.setSingleShot(True)
+        self._broadcast_timer.setInterval(50)
+        self._broadcast_timer.timeout.connect(self._flush_broadcast)
+        # Parented, so later row batches never run after the dialog is gone;
+        # finished covers both the close button and Esc.
+        self._closing = False
+        self._row_batch_timer = QtCore.QTimer(self)
+        self._row_batch_timer.setSingleShot(True)
+        self._row_batch_timer.setInterval(0)
+        self._row_batch_timer.timeout.connect(self._add_row_batch)
+        self.finished.connect(self._stop_row_batches)
         self.setWindowTitle('Multi Command Editor')
         self._build_ui()
 
@@ -781,12 +1187,6 @@ class MultiCommandDialog(QtWidgets.QDialog):
         self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         self.table.setAlternatingRowColors(True)
         self.table.setWordWrap(False)
-        self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeToContents)
-        self.table.horizontalHeader().setSectionResizeMode(1, QtWidgets.QHeaderView.Stretch)
-        self.table.horizontalHeader().setSectionResizeMode(2, QtWidgets.QHeaderView.ResizeToContents)
-        self.table.horizontalHeader().setSectionResizeMode(3, QtWidgets.QHeaderView.Fixed)
-        self.table.setColumnWidth(3, 240)
         layout.addWidget(self.table, stretch=1)
 
         self.max_params = 0
@@ -795,15 +1195,82 @@ class MultiCommandDialog(QtWidgets.QDialog):
             self.max_params = max(self.max_params, len(placeholders_in_template(t)))
 
         self._add_broadcast_table_row()
-        for c in self.commands:
-            self._add_row(c)
+        self._next_command_idx = 0
+        self._rows_deferred = False
+        self._add_row_batch()
 
+        # Start the CMD/QRY channel searches now, not on the first click.
+        parent = self.parent_window
+        parent.client.prewarm([parent.cmd_pv.text().strip(), parent.qry_pv.text().strip()])
+
+        btns = QtWidgets.QHBoxLayout()
+        write_all_btn = QtWidgets.QPushButton('Write All')
+        write_all_btn.setToolTip('Write every row command in order, skipping blocked commands.')
+        write_all_btn.clicked.connect(self._write_all_rows)
+        read_all_btn = QtWidgets.QPushButton('Read All')
+        read_all_btn.setToolTip('Send every row command in order and show each reply.')
+        read_all_btn.clicked.connect(self._read_all_rows)
         close_btn = QtWidgets.QPushButton('Close')
-        close_btn.setAutoDefault(False)
-        close_btn.setDefault(False)
+        for btn in (write_all_btn, read_all_btn, close_btn):
+            btn.setAutoDefault(False)
+            btn.setDefault(False)
         close_btn.clicked.connect(self.close)
-        layout.addWidget(close_btn)
-        self._fit_to_contents()
+        btns.addWidget(write_all_btn)
+        btns.addWidget(read_all_btn)
+        btns.addStretch(1)
+        btns.addWidget(close_btn)
+        layout.addLayout(btns)
+        self._write_all_btn = write_all_btn
+        self._read_all_btn = read_all_btn
+        self._set_bulk_actions_enabled(not self._rows_deferred)
+        if not self._rows_deferred:
+            self._fit_to_contents()
+
+    def _set_bulk_actions_enabled(self, enabled):
+        for w in (self._set_all_widget, self._write_all_btn, self._read_all_btn):
+            if w is not None:
+                w.setEnabled(enabled)
+
+    def _add_row_batch(self, batch_size=20):
+        # Rows are added in batches from the event loop, so a large selection
+        # shows (and stays responsive) before every row exists. Each batch is
+        # inserted with painting off; content-sized header modes are set once
+        # all rows are in.
+        if self._closing:
+            return
+        self.table.setUpdatesEnabled(False)
+        try:
+            end = min(len(self.commands), self._next_command_idx + batch_size)
+            # Grow the table once per batch rather than one insertRow per command.
+            row_idx = self.table.rowCount()
+            self.table.setRowCount(row_idx + end - self._next_command_idx)
+            while self._next_command_idx < end:
+                self._add_row(self.commands[self._next_command_idx], row_idx)
+                self._next_command_idx += 1
+                row_idx += 1
+        finally:
+            self.table.setUpdatesEnabled(True)
+        if self._next_command_idx < len(self.commands):
+            if not self._rows_deferred:
+                self._rows_deferred = True
+                self._set_bulk_actions_enabled(False)
+            self._row_batch_timer.start()
+            return
+        self._set_bulk_actions_enabled(True)
+        header = self.table.horizontalHeader()
+        header.setStretchLastSection(True)
+        header.setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(1, QtWidgets.QHeaderView.Stretch)
+        header.setSectionResizeMode(2, QtWidgets.QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(3, QtWidgets.QHeaderView.Fixed)
+        self.table.setColumnWidth(3, 240)
+        if self._rows_deferred:
+            # _build_ui has already returned; size the dialog for all rows now.
+            self._fit_to_contents()
+
+    def _stop_row_batches(self, _result=0):
+        self._closing = True
+        self._row_batch_timer.stop()
 
     def _set_widget_value(self, w, value):
         try:
@@ -856,6 +1323,7 @@ class MultiCommandDialog(QtWidgets.QDialog):
             inline_l.setColumnMinimumWidth(i, 156)
 
         self.table.setCellWidget(row_idx, 1, inline)
+        self._set_all_widget = inline
 
         actions = QtWidgets.QLabel('')
         self.table.setCellWidget(row_idx, 2, actions)
@@ -864,15 +1332,44 @@ class MultiCommandDialog(QtWidgets.QDialog):
         self.table.setCellWidget(row_idx, 3, result)
 
     def _broadcast_param(self, index, value):
-        for r in self.rows:
-            plist = r.get('param_widget_list', [])
-            if index >= len(plist):
-                continue
-            self._set_widget_value(plist[index], value)
+        self._pending_broadcast[index] = value
+        self._broadcast_timer.start()
+
+    def _flush_broadcast(self):
+        self._broadcast_timer.stop()
+        pending = self._pending_broadcast
+        self._pending_broadcast = {}
+        self._broadcast_values.update(pending)
+        # Nothing listens to the row editors (values are read on Write/Read),
+        # so update them silently and repaint the table once at the end.
+        viewport = self.table.viewport()
+        viewport.setUpdatesEnabled(False)
+        try:
+            for index, value in pending.items():
+                for plist in self._row_widget_lists:
+                    if index < len(plist):
+                        self._set_widget_value_quietly(plist[index], value)
+        finally:
+            viewport.setUpdatesEnabled(True)
+            viewport.update()
+
+    def _set_widget_value_quietly(self, w, value):
+        target = w.spin if isinstance(w, SpinBoxWithButtons) else w
+        blocked = target.blockSignals(True)
+        self._set_widget_value(w, value)
+        target.blockSignals(blocked)
 
     def _fit_to_contents(self):
-        self.table.resizeColumnsToContents()
-        self.table.resizeRowsToContents()
+        # Column widths come from the header modes set after the last row
+        # batch. Every command row has the same editor layout, so only the
+        # broadcast row and the first command row are measured.
+        rows = self.table.rowCount()
+        self.table.resizeRowToContents(0)
+        if rows > 1:
+            self.table.resizeRowToContents(1)
+            row_h = self.table.rowHeight(1)
+            for r in range(2, rows):
+                self.table.setRowHeight(r, row_h)
 
         frame = 2 * self.table.frameWidth()
         vheader_w = self.table.verticalHeader().width()
@@ -898,38 +1395,23 @@ class MultiCommandDialog(QtWidgets.QDialog):
 
         self.resize(max(760, wanted_w), max(240, wanted_h))
 
-    def _make_param_widget(self, ptype):
-        t = (ptype or '').lower()
-        if t in {'int', 'uint', 'i64', 'u64', 'hex', 'hex64', 'char'}:
-            w = SpinBoxWithButtons(float_mode=False)
-            if t in {'uint', 'u64', 'hex', 'hex64'}:
-                w.setRange(0, 1000000)
-            else:
-                w.setRange(-1000000, 1000000)
-            w.setSingleStep(1)
-            if t in {'hex', 'hex64'}:
-                w.setHexMode()
-            return w
-        if t in {'float', 'double'}:
+    def _make_param_widget(self, ptype, name=''):
+        kind = _param_widget_kind(ptype, name)
+        if kind == 'float':
             w = SpinBoxWithButtons(float_mode=True)
             w.setRange(-1e6, 1e6)
             w.setDecimals(4)
             w.setSingleStep(0.1)
             return w
-        # Fallback: infer numeric params from common naming patterns.
-        num_hints = (
-            'index', 'idx', 'id', 'axis', 'slave', 'master', 'enable',
-            'value', 'vel', 'acc', 'dec', 'time', 'timeout', 'size',
-            'count', 'bit', 'mask', 'offset', 'mode', 'cmd', 'pos'
-        )
-        text_hints = ('name', 'file', 'path', 'expr', 'string', 'cfg')
-        if any(h in self._current_param_name.lower() for h in num_hints) and not any(
-            h in self._current_param_name.lower() for h in text_hints
-        ):
-            w = SpinBoxWithButtons(float_mode=True)
-            w.setRange(-1e6, 1e6)
-            w.setDecimals(4)
-            w.setSingleStep(0.1)
+        if kind != 'text':
+            w = SpinBoxWithButtons(float_mode=False)
+            if kind == 'int':
+                w.setRange(-1000000, 1000000)
+            else:
+                w.setRange(0, 1000000)
+            w.setSingleStep(1)
+            if kind == 'hex':
+                w.setHexMode()
             return w
 
         w = QtWidgets.QLineEdit('')
@@ -937,20 +1419,17 @@ class MultiCommandDialog(QtWidgets.QDialog):
         w.setFixedHeight(24)
         return w
 
-    def _widget_value(self, w):
+    def _value_getter(self, w):
+        # Resolved once per row, so building a command does no type dispatch.
         if isinstance(w, SpinBoxWithButtons):
-            if isinstance(w.spin, QtWidgets.QDoubleSpinBox):
-                return compact_float_text(w.value())
-            return str(int(w.value()))
+            w = w.spin
         if isinstance(w, QtWidgets.QDoubleSpinBox):
-            return compact_float_text(w.value())
+            return lambda: compact_float_text(w.value())
         if isinstance(w, QtWidgets.QSpinBox):
-            return str(int(w.value()))
-        return w.text().strip()
+            return lambda: str(int(w.value()))
+        return lambda: w.text().strip()
 
-    def _add_row(self, command_data):
-        row_idx = self.table.rowCount()
-        self.table.insertRow(row_idx)
+    def _add_row(self, command_data, row_idx):
         self.table.setRowHeight(row_idx, 42)
 
         template = command_data.get('command_named', command_data.get('command', ''))
@@ -972,15 +1451,14 @@ class MultiCommandDialog(QtWidgets.QDialog):
         inline_l.setVerticalSpacing(1)
 
         param_names = placeholders_in_template(template)
-        parser_types = placeholders_in_parser_signature(command_data.get('parser_command', ''))
+        parser_types = _param_types_for(str(template or ''), str(command_data.get('parser_command', '') or ''))
         param_widgets = {}
         param_widget_list = []
         for i in range(self.max_params):
             if i < len(param_names):
                 p_name = param_names[i]
-                p_type = parser_types[i] if i < len(parser_types) else ''
-                self._current_param_name = p_name
-                pw = self._make_param_widget(p_type)
+                p_type = parser_types[i]
+                pw = self._make_param_widget(p_type, p_name)
                 pw.setToolTip(f"Parameter: {p_name}" + (f" (type: {p_type})" if p_type else ""))
                 param_widgets[p_name] = pw
                 param_widget_list.append(pw)
@@ -990,11 +1468,16 @@ class MultiCommandDialog(QtWidgets.QDialog):
                 spacer.setEnabled(False)
                 spacer.setFixedWidth(120)
                 spacer.setFixedHeight(24)
-                spacer.setStyleSheet('QLineEdit { background: #f4f4f4; color: #f4f4f4; border: 1px solid #eee; }')
+                spacer.setStyleSheet(_PARAM_SPACER_QSS)
                 inline_l.addWidget(spacer, 0, i)
 
             inline_l.setColumnMinimumWidth(i, 156)
 
+        # Rows from a later batch start from the "Set all" values.
+        for index, value in self._broadcast_values.items():
+            if index < len(param_widget_list):
+                self._set_widget_value_quietly(param_widget_list[index], value)
+
         self.table.setCellWidget(row_idx, 1, inline)
 
         actions = QtWidgets.QWidget()
@@ -1018,104 +1501,398 @@ class MultiCommandDialog(QtWidgets.QDialog):
         result.setWordWrap(False)
         self.table.setCellWidget(row_idx, 3, result)
 
-        data_idx = len(self.rows)
-        row = {
-            'template': template,
-            'param_names': param_names,
-            'param_widgets': param_widgets,
-            'param_widget_list': param_widget_list,
-            'result': result,
-        }
-        self.rows.append(row)
+        data_idx = len(self._row_results)
+        # Split the template once; _build_command only fills the placeholder
+        # slots (odd indexes of the split) from their widgets.
+        parts = _template_parts(str(template or ''))
+        self._row_parts.append(parts)
+        self._row_slots.append(
+            tuple((i, parts[i], self._value_getter(param_widgets[parts[i]])) for i in range(1, len(parts), 2))
+        )
+        self._row_widget_lists.append(param_widget_list)
+        self._row_results.append(result)
 
         write_btn.clicked.connect(lambda _=False, i=data_idx: self._write_row(i))
         read_btn.clicked.connect(lambda _=False, i=data_idx: self._read_row(i))
 
     def _build_command(self, row_idx):
-        row = self.rows[row_idx]
-        values = {n: self._widget_value(w) for n, w in row['param_widgets'].items()}
-        return fill_template(row['template'], values)
+        if self._pending_broadcast:
+            self._flush_broadcast()
+        out = list(self._row_parts[row_idx])
+        for i, name, value in self._row_slots[row_idx]:
+            v = value()
+            out[i] = v if v else f'<{name}>'
+        return ''.join(out)
 
     def _write_row(self, row_idx):
         cmd = self._build_command(row_idx).strip()
         if self.parent_window._is_blocked_command_text(cmd):
-            self.rows[row_idx]['result'].setText('Blocked command')
+            self._row_results[row_idx].setText('Blocked command')
             self.parent_window._log('Blocked command cannot be written from Selected Panel')
             return
-        ok, msg = self.parent_window.read_raw_command(cmd)
-        self.rows[row_idx]['result'].setText(compact_query_message_value(msg))
+        self._send_row(row_idx, cmd)
 
     def _read_row(self, row_idx):
-        cmd = self._build_command(row_idx).strip()
-        ok, msg = self.parent_window.read_raw_command(cmd)
-        self.rows[row_idx]['result'].setText(compact_query_message_value(msg))
+        self._send_row(row_idx, self._build_command(row_idx).strip())
+
+    def _write_all_rows(self):
+        for row_idx in range(len(self._row_results)):
+            self._write_row(row_idx)
+
+    def _read_all_rows(self):
+        # All rows share the CMD/QRY pair, so they cannot be read in one CA
+        # batch; they are queued to the command worker, which runs them in order.
+        for row_idx in range(len(self._row_results)):
+            self._read_row(row_idx)
+
+    def _send_row(self, row_idx, cmd):
+        result = self._row_results[row_idx]
+        result.setText('Busy...')
+        self.parent_window.read_raw_command_async(
+            cmd, lambda _ok, msg: result.setText(compact_query_message_value(msg))
+        )
 
     def _copy_row(self, row_idx):
         cmd = self._build_command(row_idx).strip()
         QtWidgets.QApplication.clipboard().setText(cmd)
-        self.rows[row_idx]['result'].setText('Copied')
+        self._row_results[row_idx].setText('Copied')
+
+
+class CommandListModel(QtCore.QAbstractListModel):
+    # Read-only view over the filtered catalog entries; a refilter is one model
+    # reset instead of a QListWidgetItem per row.
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._commands = []
+        self._blocked_brush = QtGui.QBrush(QtGui.QColor('#8a8a8a'))
+
+    def set_commands(self, commands):
+        # Returns False when the rows are the same entries as before, so the view
+        # keeps its items and selection instead of being reset.
+        old = self._commands
+        if len(old) == len(commands) and all(a is b for a, b in zip(old, commands)):
+            return False
+        self.beginResetModel()
+        self._commands = list(commands)
+        self.endResetModel()
+        return True
 
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._commands)
 
-class MainWindow(QtWidgets.QMainWindow):
-    def __init__(self, catalog_path, blocklist_path, default_cmd_pv, default_qry_pv, timeout, error_db_path=''):
-        super().__init__()
-        self.setWindowTitle('ecmc Command Parser')
-        self.resize(640, 480)
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        c = self._commands[index.row()]
+        if role == QtCore.Qt.DisplayRole:
+            return c['_label']
+        if role == QtCore.Qt.ToolTipRole:
+            return c['_tooltip']
+        if role == QtCore.Qt.ForegroundRole and c['_blocked']:
+            return self._blocked_brush
+        return None
 
-        self.client = EpicsClient(timeout=timeout)
-        self.catalog = self._load_catalog(catalog_path)
-        self._blocklist_load_error = ''
-        self.blocked_commands = self._load_blocklist(blocklist_path)
-        self._blocked_category_count = self._apply_blocked_category()
-        self.error_name_by_code = load_local_error_name_map(error_db_path)
-        self._child_windows = []
 
-        self._build_ui(default_cmd_pv, default_qry_pv, timeout)
-        self._populate_commands()
-        self._log(f'Connected via backend: {self.client.backend}')
-        if self._blocklist_load_error:
-            self._log(f'Blocklist load error: {self._blocklist_load_error}')
-        else:
-            self._log(f'Blocklist loaded: {len(self.blocked_commands)} entries; marked {self._blocked_category_count} commands as Blocked')
-        if self.error_name_by_code:
-            self._log(f'Loaded local error DB: {len(self.error_name_by_code)} codes')
+def _command_io(client, cmd_pv, cmd, qry_pv):
+    # CMD put + QRY get; returns (put_error, value), value None when no QRY PV.
+    try:
+        client.put(cmd_pv, cmd, wait=True)
+    except Exception as ex:
+        return ex, None
+    if not qry_pv:
+        return None, None
+    try:
+        val = client.get(qry_pv, as_string=True)
+    except Exception as ex:
+        val = ex
+    return None, val
+
+
+def _query_io(client, proc_pv, qry_pv):
+    # Optional PROC put, then QRY get; same (put_error, value) shape.
+    try:
+        if proc_pv:
+            client.put(proc_pv, 1, wait=True)
+        val = client.get(qry_pv, as_string=True)
+    except Exception as ex:
+        val = ex
+    return None, val
+
+
+class CommandIoWorker(QtCore.QObject):
+    # Runs CMD put + QRY get pairs on its own thread, one request at a time, so
+    # a query never reads back the answer to another row's command.
+    finished = Signal(int, object)
+
+    def __init__(self, client):
+        super().__init__()
+        # Not the window's client: EpicsClient's PV caches and backend
+        # fallback are not safe to share between threads.
+        self.client = client
+        self._ca_attached = False
+
+    def _attach_ca(self):
+        if not self._ca_attached:
+            self._ca_attached = True
+            if self.client.backend == 'pyepics':
+                # pyepics channels must be used from the shared CA context.
+                self.client._epics.ca.use_initial_context()
+
+    @Slot(int, str, str, str)
+    def run(self, req_id, cmd_pv, cmd, qry_pv):
+        self._attach_ca()
+        self.finished.emit(req_id, _command_io(self.client, cmd_pv, cmd, qry_pv))
+
+    @Slot(int, str, str)
+    def read_query(self, req_id, proc_pv, qry_pv):
+        self._attach_ca()
+        self.finished.emit(req_id, _query_io(self.client, proc_pv, qry_pv))
+
+
+class CatalogLoadWorker(QtCore.QObject):
+    # Reads and prepares the command catalog off the UI thread.
+    loaded = Signal(object)
+
+    def __init__(self, catalog_path, blocklist_path, use_cache=True):
+        super().__init__()
+        self.catalog_path = catalog_path
+        self.blocklist_path = blocklist_path
+        self.use_cache = use_cache
+
+    @Slot()
+    def run(self):
+        self.loaded.emit(self._load_state(self.catalog_path, self.blocklist_path, self.use_cache))
+
+    def _load_state(self, catalog_path, blocklist_path, use_cache=True):
+        # The prepared catalog (Blocked marks, search text and blob) is cached
+        # as JSON in the user's cache dir, keyed on both input files and this
+        # module.
+        cache_file = None
+        if use_cache:
+            key = repr(
+                (
+                    _file_fingerprint(Path(catalog_path)),
+                    _file_fingerprint(Path(blocklist_path) if blocklist_path else Path('ecmc_commands_blocklist_all.json')),
+                    _file_fingerprint(Path(__file__)),
+                )
+            )
+            digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+            cache_dir = _user_cache_dir()
+            if cache_dir is not None:
+                cache_file = cache_dir / f'catalog_{digest}.json'
+                try:
+                    return self._state_from_cache(_read_json_file(cache_file))
+                except Exception:
+                    pass
+
+        catalog = self._load_catalog(catalog_path)
+        blocked, blocklist_error = self._load_blocklist(blocklist_path)
+        blocked_count, search_blob, name_index = self._index_catalog(catalog, blocked)
+        state = {
+            'catalog': catalog,
+            'blocked_commands': blocked,
+            'blocked_count': blocked_count,
+            'search_blob': search_blob,
+            'name_index': name_index,
+        }
+        if cache_file is not None and not blocklist_error:
+            try:
+                cached = dict(state, blocked_commands=sorted(blocked))
+                if orjson is not None:
+                    data = orjson.dumps(cached)
+                else:
+                    data = json.dumps(cached, separators=(',', ':')).encode('utf-8')
+                tmp = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+                tmp.write_bytes(data)
+                tmp.replace(cache_file)
+            except Exception:
+                pass
+        state['blocklist_error'] = blocklist_error
+        return state
+
+    def _state_from_cache(self, cached):
+        # JSON turns tuples/sets into lists; restore what lookups rely on.
+        commands = cached['catalog']['commands']
+        for c in commands:
+            for k in _SHARED_CATALOG_FIELDS:
+                v = c.get(k)
+                if type(v) is str:
+                    c[k] = sys.intern(v)
+            c['_sort_key'] = tuple(c['_sort_key'])
+        blob, starts = cached['search_blob']
+        keys, order = cached['name_index']
+        return {
+            'catalog': cached['catalog'],
+            'blocked_commands': frozenset(cached['blocked_commands']),
+            'blocked_count': int(cached['blocked_count']),
+            'search_blob': (blob, starts),
+            'name_index': (keys, order),
+            'blocklist_error': '',
+        }
 
     def _load_catalog(self, path):
         p = Path(path)
         if not p.exists():
             return {'commands': []}
         try:
-            return json.loads(p.read_text())
+            return _read_json_file(p)
         except Exception:
             return {'commands': []}
 
     def _load_blocklist(self, path):
         p = Path(path) if path else Path('ecmc_commands_blocklist_all.json')
         if not p.exists():
-            return set()
+            return frozenset(), ''
         try:
-            data = json.loads(p.read_text())
+            data = _read_json_file(p)
         except Exception as ex:
-            self._blocklist_load_error = str(ex)
-            return set()
+            return frozenset(), str(ex)
         if isinstance(data, dict):
             items = data.get('commands', [])
         elif isinstance(data, list):
             items = data
         else:
             items = []
-        return {str(x).strip() for x in items if str(x).strip()}
-
-    def _apply_blocked_category(self):
-        if not self.blocked_commands:
-            return 0
-        count = 0
-        for c in self.catalog.get('commands', []):
-            named = str(c.get('command_named', c.get('command', ''))).strip()
-            if named in self.blocked_commands:
+        # Entries are normalized once so lookups only normalize the typed command.
+        return frozenset(normalize_float_literals(t) for t in (str(x).strip() for x in items) if t), ''
+
+    def _index_catalog(self, catalog, blocked):
+        # Blocked marks, search text and sort key only depend on catalog fields,
+        # so they are built once in a single pass. All search texts are also
+        # joined into one blob so a query is a few str.find calls in C instead
+        # of a Python loop over every command.
+        commands = catalog.get('commands', [])
+        blocked_count = 0
+        for c in commands:
+            # These repeat across most of the catalog; share one string each.
+            for k in _SHARED_CATALOG_FIELDS:
+                v = c.get(k)
+                if type(v) is str:
+                    c[k] = sys.intern(v)
+            named = str(c.get('command_named', c.get('command', '')) or '')
+            if blocked and normalize_float_literals(named.strip()) in blocked:
                 c['category'] = 'Blocked'
-                count += 1
-        return count
+                blocked_count += 1
+            c['_hay'] = ' | '.join(
+                [
+                    str(c.get('command', '') or ''),
+                    named,
+                    str(c.get('name', '') or ''),
+                    str(c.get('category', '') or ''),
+                    str(c.get('description', '') or ''),
+                ]
+            ).lower()
+            c['_sort_key'] = (str(c.get('category', 'General') or '').lower(), named.lower())
+            c['_blocked'] = str(c.get('category', '') or '').strip().lower() == 'blocked'
+            params = c.get('param_names', []) or []
+            c['_label'] = f"[{c.get('category', 'General')}] {named}"
+            c['_tooltip'] = f"Command: {named}\nParameters: {', '.join(params) if params else '-'}"
+            c['_details'] = self._command_details_text(c)
+        # Stored in display order so filtering never has to re-sort.
+        commands.sort(key=itemgetter('_sort_key'))
+        starts = []
+        pos = 0
+        for c in commands:
+            starts.append(pos)
+            pos += len(c['_hay']) + 1
+        # Sorted (lowercase command name, display index) pairs for "^prefix"
+        # queries, which bisect instead of scanning.
+        names = sorted(
+            (str(c.get('command_named', c.get('command', '')) or '').lower(), idx)
+            for idx, c in enumerate(commands)
+        )
+        name_index = ([n for n, _ in names], [i for _, i in names])
+        return blocked_count, ('\x1f'.join(c['_hay'] for c in commands), starts), name_index
+
+    def _command_details_text(self, c):
+        params = c.get('param_names', []) or []
+        lines = [
+            f"Command: {c.get('command', '')}",
+            f"Command (named): {c.get('command_named', c.get('command', ''))}",
+            f"Parameters: {', '.join(params) if params else '-'}",
+            f"Runtime safe: {c.get('runtime_safe', False)}",
+            f"Runtime class: {c.get('runtime_class', 'unknown')}",
+            f"Runtime note: {c.get('runtime_note', '-') or '-'}",
+            f"Name: {c.get('name', '')}",
+            f"Category: {c.get('category', '')}",
+            f"Description: {c.get('description', '') or '(no header description found)'}",
+            f"Header: {c.get('header_source', '') or '-'}",
+            f"Header example: {c.get('header_example', '') or '-'}",
+            f"Parser command: {c.get('parser_command', '') or '-'}",
+            f"Parser source: {c.get('parser_source', '')}",
+        ]
+        return '\n'.join(lines)
+
+
+class MainWindow(QtWidgets.QMainWindow):
+    command_io_requested = Signal(int, str, str, str)
+    query_io_requested = Signal(int, str, str)
+
+    def __init__(self, catalog_path, blocklist_path, default_cmd_pv, default_qry_pv, timeout, error_db_path='', use_cache=True):
+        super().__init__()
+        self.setWindowTitle('ecmc Command Parser')
+        self.resize(640, 480)
+
+        self.client = EpicsClient(timeout=timeout)
+        self.catalog = {'commands': []}
+        self.blocked_commands = frozenset()
+        self._search_blob = ('', [])
+        self._name_index = ([], [])
+        self._unblocked_commands = []
+        self._last_filter_key = None
+        self._match_cache = OrderedDict()
+        self._last_match = ('', [])
+        self.error_name_by_code = load_local_error_name_map(error_db_path)
+        self._child_windows = []
+        self._closing = False
+        self._cmd_io_seq = 0
+        self._cmd_io_pending = {}
+        self._cmd_io_thread = QtCore.QThread(self)
+        self._cmd_io_worker = None
+        if self.client.backend in ('pyepics', 'cli'):
+            # epicsPV has no CA context attach for other threads; its command
+            # IO stays on the GUI thread.
+            self._cmd_io_worker = CommandIoWorker(EpicsClient(timeout=timeout))
+            self._cmd_io_worker.moveToThread(self._cmd_io_thread)
+            self.command_io_requested.connect(self._cmd_io_worker.run)
+            self.query_io_requested.connect(self._cmd_io_worker.read_query)
+            self._cmd_io_worker.finished.connect(self._on_command_io_done)
+            self._cmd_io_thread.start()
+
+        self._build_ui(default_cmd_pv, default_qry_pv, timeout)
+        self._populate_commands()
+        self._log(f'Connected via backend: {self.client.backend}')
+        if self.error_name_by_code:
+            self._log(f'Loaded local error DB: {len(self.error_name_by_code)} codes')
+        self._log('Loading command catalog...')
+        self._catalog_thread = QtCore.QThread(self)
+        self._catalog_worker = CatalogLoadWorker(catalog_path, blocklist_path, use_cache)
+        self._catalog_worker.moveToThread(self._catalog_thread)
+        self._catalog_thread.started.connect(self._catalog_worker.run)
+        self._catalog_worker.loaded.connect(self._on_catalog_loaded)
+        self._catalog_thread.start()
+
+    def _on_catalog_loaded(self, state):
+        self._catalog_thread.quit()
+        if self._closing:
+            # Arrived after closeEvent gave up waiting for the loader.
+            return
+        self.catalog = state['catalog']
+        self.blocked_commands = state['blocked_commands']
+        self._search_blob = state['search_blob']
+        self._name_index = state['name_index']
+        # The unfiltered default view, so toggling "All commands" with an empty
+        # search does not rescan the catalog.
+        self._unblocked_commands = [c for c in self.catalog.get('commands', []) if not c['_blocked']]
+        self._last_filter_key = None
+        self._match_cache = OrderedDict()
+        self._last_match = ('', [])
+        self._populate_commands()
+        self._log(f"Catalog loaded: {len(self.catalog.get('commands', []))} commands")
+        if state['blocklist_error']:
+            self._log(f"Blocklist load error: {state['blocklist_error']}")
+        else:
+            self._log(f"Blocklist loaded: {len(self.blocked_commands)} entries; marked {state['blocked_count']} commands as Blocked")
 
     def _build_ui(self, default_cmd_pv, default_qry_pv, timeout):
         root = QtWidgets.QWidget()
@@ -1219,6 +1996,15 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.response = QtWidgets.QPlainTextEdit()
         self.response.setReadOnly(True)
+        self.response.setMaximumBlockCount(2000)
+        self.response.setUndoRedoEnabled(False)
+        # Log lines are appended in one batch per ~30 Hz tick; older pending
+        # lines than the widget keeps are dropped before they are drawn.
+        self._log_buffer = deque(maxlen=2000)
+        self._log_flush_timer = QtCore.QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(33)
+        self._log_flush_timer.timeout.connect(self._flush_log)
 
         main_split.addWidget(upper)
 
@@ -1229,8 +2015,13 @@ class MainWindow(QtWidgets.QMainWindow):
 
         search_row = QtWidgets.QHBoxLayout()
         self.search = QtWidgets.QLineEdit()
-        self.search.setPlaceholderText('Filter commands or descriptions...')
-        self.search.textChanged.connect(self._populate_commands)
+        self.search.setPlaceholderText('Filter commands or descriptions... (^ for name prefix)')
+        # Typing bursts refilter the command list once.
+        self._filter_timer = QtCore.QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(120)
+        self._filter_timer.timeout.connect(self._populate_commands)
+        self.search.textChanged.connect(lambda _txt: self._filter_timer.start())
         self.show_all_commands = QtWidgets.QCheckBox('All commands')
         self.show_all_commands.setChecked(False)
         self.show_all_commands.toggled.connect(self._populate_commands)
@@ -1241,10 +2032,22 @@ class MainWindow(QtWidgets.QMainWindow):
         browser_split = QtWidgets.QSplitter()
         browser_split.setOrientation(QtCore.Qt.Vertical)
 
-        self.command_list = QtWidgets.QListWidget()
+        self.command_model = CommandListModel(self)
+        self.command_list = QtWidgets.QListView()
+        self.command_list.setUniformItemSizes(True)
+        self.command_list.setModel(self.command_model)
         self.command_list.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
-        self.command_list.currentRowChanged.connect(self._show_command_details)
-        self.command_list.itemDoubleClicked.connect(self._use_selected_command)
+        # Held arrow keys only render the row they stop on.
+        self._detail_timer = QtCore.QTimer(self)
+        self._detail_timer.setSingleShot(True)
+        self._detail_timer.setInterval(50)
+        self._detail_timer.timeout.connect(
+            lambda: self._show_command_details(self.command_list.currentIndex().row())
+        )
+        self.command_list.selectionModel().currentRowChanged.connect(
+            lambda _cur, _prev: self._detail_timer.start()
+        )
+        self.command_list.doubleClicked.connect(lambda _idx: self._use_selected_command())
         browser_split.addWidget(self.command_list)
 
         btns = QtWidgets.QHBoxLayout()
@@ -1258,6 +2061,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.details = QtWidgets.QPlainTextEdit()
         self.details.setReadOnly(True)
+        self.details.setUndoRedoEnabled(False)
         browser_split.addWidget(self.details)
         browser_split.setSizes([220, 110])
         lower_l.addWidget(browser_split, stretch=1)
@@ -1280,19 +2084,27 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _set_timeout(self, value):
         self.client.timeout = float(value)
+        if self._cmd_io_worker is not None:
+            self._cmd_io_worker.client.timeout = float(value)
 
     def _ioc_prefix_for_title(self):
         cmd_pv = self.cmd_pv.text().strip() if hasattr(self, 'cmd_pv') else ''
-        m = re.match(r'^(.*):MCU-Cmd\.AOUT$', cmd_pv)
+        m = IOC_PREFIX_RE.match(cmd_pv)
         return m.group(1) if m else ''
 
     def _open_caqtdm_main_panel(self):
         ioc_prefix = self._ioc_prefix_for_title() or ''
         macro = f'IOC={ioc_prefix}'
         try:
-            cmd = f'caqtdm -macro "{macro}" ecmcMain.ui'
+            # Exec caqtdm directly when it is on PATH; only fall back to a login
+            # shell (which may set up the EPICS environment) when it is not.
+            caqtdm = shutil.which('caqtdm')
+            if caqtdm:
+                argv = [caqtdm, '-macro', macro, 'ecmcMain.ui']
+            else:
+                argv = ['bash', '-lc', f'caqtdm -macro "{macro}" ecmcMain.ui']
             subprocess.Popen(
-                ['bash', '-lc', cmd],
+                argv,
                 cwd=str(Path(__file__).resolve().parent),
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
@@ -1433,60 +2245,85 @@ class MainWindow(QtWidgets.QMainWindow):
             self.readback_edit.setText(str(text or ''))
 
     def _log(self, msg):
-        t = datetime.now().strftime('%H:%M:%S')
-        self.response.appendPlainText(f'[{t}] {msg}')
-
-    def _filtered_commands(self):
-        txt = self.search.text().strip().lower()
+        self._log_buffer.append(f"[{time.strftime('%H:%M:%S')}] {msg}")
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log(self):
+        if self._log_buffer:
+            self.response.appendPlainText('\n'.join(self._log_buffer))
+            self._log_buffer.clear()
+
+    def _filtered_commands(self, txt=None, show_all=None):
+        if txt is None:
+            txt = self.search.text().strip().lower()
+        if show_all is None:
+            show_all = bool(self.show_all_commands.isChecked()) if hasattr(self, 'show_all_commands') else False
+        if not txt and not show_all:
+            return list(self._unblocked_commands)
+        matches = self._matching_commands(txt)
+        if show_all:
+            return list(matches)
+        # Toggling "All commands" only masks Blocked entries out of the text
+        # matches, so the search itself is reused.
+        return [c for c in matches if not c['_blocked']]
+
+    def _matching_commands(self, txt):
+        # Small LRU of query -> matches; backspacing and retyping a query
+        # hits it. The catalog only changes when a new one is loaded, which
+        # replaces the cache.
+        cached = self._match_cache.get(txt)
+        if cached is not None:
+            self._match_cache.move_to_end(txt)
+            self._last_match = (txt, cached)
+            return cached
         cmds = self.catalog.get('commands', [])
-        show_all = bool(self.show_all_commands.isChecked()) if hasattr(self, 'show_all_commands') else False
-
         out = []
-        for c in cmds:
-            if (not show_all) and str(c.get('category', '') or '').strip().lower() == 'blocked':
-                continue
-            if not txt:
-                out.append(c)
-                continue
-            hay = ' | '.join(
-                [
-                    c.get('command', ''),
-                    c.get('command_named', c.get('command', '')),
-                    c.get('name', ''),
-                    c.get('category', ''),
-                    c.get('description', ''),
-                ]
-            ).lower()
-            if txt in hay:
-                out.append(c)
+        if not txt:
+            out = cmds
+        elif txt[0] == '^':
+            # Command name prefix: a bisect range, reported in display order.
+            prefix = txt[1:].strip()
+            keys, order = self._name_index
+            lo = bisect_left(keys, prefix)
+            hi = bisect_right(keys, prefix + '\U0010ffff', lo)
+            out = [cmds[i] for i in sorted(order[lo:hi])]
+        elif '\x1f' not in txt and self._narrows_last_match(txt):
+            # Typing forward only removes matches: rescan the previous hits.
+            out = [c for c in self._last_match[1] if txt in c['_hay']]
+        elif '\x1f' not in txt:
+            blob, starts = self._search_blob
+            count = len(starts)
+            pos = blob.find(txt)
+            while pos != -1:
+                idx = bisect_right(starts, pos) - 1
+                out.append(cmds[idx])
+                if idx + 1 >= count:
+                    break
+                # Resume at the next command so each one is listed once.
+                pos = blob.find(txt, starts[idx + 1])
+        self._match_cache[txt] = out
+        if len(self._match_cache) > 64:
+            self._match_cache.popitem(last=False)
+        self._last_match = (txt, out)
         return out
 
+    def _narrows_last_match(self, txt):
+        last_txt = self._last_match[0]
+        return bool(last_txt) and last_txt[0] != '^' and txt.startswith(last_txt)
+
     def _populate_commands(self):
-        self.filtered = sorted(
-            self._filtered_commands(),
-            key=lambda c: (
-                str(c.get('category', 'General') or '').lower(),
-                str(c.get('command_named', c.get('command', '')) or '').lower(),
-            ),
-        )
-        self.command_list.clear()
-        for c in self.filtered:
-            label = (
-                f"[{c.get('category', 'General')}] "
-                f"{c.get('command_named', c.get('command', ''))}"
-            )
-            params = c.get('param_names', []) or []
-            tooltip = (
-                f"Command: {c.get('command_named', c.get('command', ''))}\n"
-                f"Parameters: {', '.join(params) if params else '-'}"
-            )
-            item = QtWidgets.QListWidgetItem(label)
-            item.setToolTip(tooltip)
-            if str(c.get('category', '') or '').strip().lower() == 'blocked':
-                item.setForeground(QtGui.QColor('#8a8a8a'))
-            self.command_list.addItem(item)
+        txt = self.search.text().strip().lower()
+        show_all = bool(self.show_all_commands.isChecked())
+        key = (txt, show_all)
+        if key == self._last_filter_key:
+            return
+        self._last_filter_key = key
+        self.filtered = self._filtered_commands(txt, show_all)
+        if not self.command_model.set_commands(self.filtered):
+            return
         if self.filtered:
-            self.command_list.setCurrentRow(0)
+            self.command_list.setCurrentIndex(self.command_model.index(0))
         else:
             self.details.setPlainText('')
 
@@ -1495,40 +2332,18 @@ class MainWindow(QtWidgets.QMainWindow):
             self.details.setPlainText('')
             return
 
-        c = self.filtered[row]
-        params = c.get('param_names', []) or []
-        lines = [
-            f"Command: {c.get('command', '')}",
-            f"Command (named): {c.get('command_named', c.get('command', ''))}",
-            f"Parameters: {', '.join(params) if params else '-'}",
-            f"Runtime safe: {c.get('runtime_safe', False)}",
-            f"Runtime class: {c.get('runtime_class', 'unknown')}",
-            f"Runtime note: {c.get('runtime_note', '-') or '-'}",
-            f"Name: {c.get('name', '')}",
-            f"Category: {c.get('category', '')}",
-            f"Description: {c.get('description', '') or '(no header description found)'}",
-            f"Header: {c.get('header_source', '') or '-'}",
-            f"Header example: {c.get('header_example', '') or '-'}",
-            f"Parser command: {c.get('parser_command', '') or '-'}",
-            f"Parser source: {c.get('parser_source', '')}",
-        ]
-        self.details.setPlainText('\n'.join(lines))
+        self.details.setPlainText(self.filtered[row]['_details'])
 
     def _selected_command(self):
-        row = self.command_list.currentRow()
+        row = self.command_list.currentIndex().row()
         if row < 0 or row >= len(getattr(self, 'filtered', [])):
             return None
         return self.filtered[row]
 
     def _selected_commands(self):
-        rows = sorted({idx.row() for idx in self.command_list.selectedIndexes()})
+        rows = sorted(idx.row() for idx in self.command_list.selectionModel().selectedRows())
         return [self.filtered[r] for r in rows if 0 <= r < len(self.filtered)]
 
-    def _is_blocked_catalog_command(self, cmd_obj):
-        if not cmd_obj:
-            return False
-        return str(cmd_obj.get('category', '') or '').strip().lower() == 'blocked'
-
     def _is_blocked_command_text(self, cmd_text):
         txt = normalize_float_literals(str(cmd_text or '').strip())
         if not txt:
@@ -1539,7 +2354,7 @@ class MainWindow(QtWidgets.QMainWindow):
         c = self._selected_command()
         if not c:
             return
-        if self._is_blocked_catalog_command(c):
+        if c['_blocked']:
             self._log('Blocked command cannot be inserted into Send Command field')
             return
         self.command_edit.setText(c.get('command_named', c.get('command', '')))
@@ -1553,39 +2368,78 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _open_selected_panel(self):
         commands = self._selected_commands()
-        commands = [c for c in commands if not self._is_blocked_catalog_command(c)]
+        commands = [c for c in commands if not c['_blocked']]
         if not commands:
             self._log('ERROR: Select one or more non-blocked commands first')
             return
         dlg = MultiCommandDialog(self, commands)
+        # Closed panels are deleted and dropped, so reopening panels over a
+        # long session does not keep every old one alive.
+        dlg.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+        dlg.finished.connect(lambda _=0, d=dlg: self._child_windows.remove(d))
         self._child_windows.append(dlg)
         dlg.show()
 
-    def send_raw_command(self, cmd):
+    def _prepare_raw_command(self, cmd):
+        # Returns (pv, normalized cmd, None) or (None, None, (False, msg)).
         pv = self.cmd_pv.text().strip()
         cmd = normalize_float_literals((cmd or '').strip())
         if not pv:
             msg = 'ERROR: Command PV is empty'
             self._log(msg)
-            return False, msg
+            return None, None, (False, msg)
         if not cmd:
             msg = 'ERROR: Command text is empty'
             self._log(msg)
-            return False, msg
+            return None, None, (False, msg)
         if not self._confirm_config_only_command(cmd):
             msg = f'Canceled config command: {cmd}'
             self._log(msg)
             self._set_readback_field(msg)
+            return None, None, (False, msg)
+        return pv, cmd, None
+
+    def _sent_raw_command_result(self, pv, cmd, put_error):
+        if put_error is not None:
+            msg = f'ERROR sending command ({len(cmd)} chars): {put_error} | CMD={cmd}'
+            self._log(msg)
             return False, msg
-        try:
-            self.client.put(pv, cmd, wait=True)
-            msg = f'CMD -> {pv} ({len(cmd)} chars): {cmd}'
+        msg = f'CMD -> {pv} ({len(cmd)} chars): {cmd}'
+        self._log(msg)
+        return True, msg
+
+    def _query_result(self, cmd, qp, val):
+        if not qp:
+            msg = f'Command sent, no QRY PV configured: {cmd}'
             self._log(msg)
+            self._set_readback_field(msg)
             return True, msg
-        except Exception as ex:
-            msg = f'ERROR sending command ({len(cmd)} chars): {ex} | CMD={cmd}'
+        if isinstance(val, Exception):
+            msg = f'ERROR query read: {val}'
             self._log(msg)
+            self._set_readback_field(msg)
             return False, msg
+        if query_value_indicates_error(val):
+            short = summarize_error_text(val, self.error_name_by_code)
+            msg = f'QRY ERROR <- {qp}: {short}'
+            self._log(msg)
+            self._set_readback_field(short)
+            return False, msg
+        msg = compact_query_message_value(f'QRY <- {qp}: {val}')
+        self._log(msg)
+        self._set_readback_field(val)
+        return True, msg
+
+    def send_raw_command(self, cmd):
+        pv, cmd, failed = self._prepare_raw_command(cmd)
+        if failed is not None:
+            return failed
+        try:
+            self.client.put(pv, cmd, wait=True)
+            put_error = None
+        except Exception as ex:
+            put_error = ex
+        return self._sent_raw_command_result(pv, cmd, put_error)
 
     def read_raw_command(self, cmd):
         ok, msg = self.send_raw_command(cmd)
@@ -1594,60 +2448,98 @@ class MainWindow(QtWidgets.QMainWindow):
             return False, msg
 
         qp = self.qry_pv.text().strip()
-        if not qp:
-            msg = f'Command sent, no QRY PV configured: {cmd}'
-            self._log(msg)
+        val = None
+        if qp:
+            try:
+                val = self.client.get(qp, as_string=True)
+            except Exception as ex:
+                val = ex
+        return self._query_result(cmd, qp, val)
+
+    def read_raw_command_async(self, cmd, callback):
+        """Like read_raw_command, but the CMD/QRY IO runs on the worker thread
+        (inline with the epicsPV backend); callback(ok, msg) is called on the
+        GUI thread with the result."""
+        pv, cmd, failed = self._prepare_raw_command(cmd)
+        if failed is not None:
+            self._set_readback_field(failed[1])
+            callback(*failed)
+            return
+        qp = self.qry_pv.text().strip()
+        if self._cmd_io_worker is None:
+            self._finish_raw_command(pv, cmd, qp, callback, _command_io(self.client, pv, cmd, qp))
+            return
+        self._cmd_io_seq += 1
+        self._cmd_io_pending[self._cmd_io_seq] = (
+            lambda result: self._finish_raw_command(pv, cmd, qp, callback, result)
+        )
+        self.command_io_requested.emit(self._cmd_io_seq, pv, cmd, qp)
+
+    def _read_query_async(self, proc_pv, qp):
+        if self._cmd_io_worker is None:
+            self._show_query_value(qp, _query_io(self.client, proc_pv, qp)[1])
+            return
+        self._cmd_io_seq += 1
+        self._cmd_io_pending[self._cmd_io_seq] = lambda result: self._show_query_value(qp, result[1])
+        self.query_io_requested.emit(self._cmd_io_seq, proc_pv, qp)
+
+    def _on_command_io_done(self, req_id, result):
+        handler = self._cmd_io_pending.pop(req_id, None)
+        if handler is not None:
+            handler(result)
+
+    def _finish_raw_command(self, pv, cmd, qp, callback, result):
+        put_error, val = result
+        ok, msg = self._sent_raw_command_result(pv, cmd, put_error)
+        if not ok:
             self._set_readback_field(msg)
-            return True, msg
+        else:
+            ok, msg = self._query_result(cmd, qp, val)
+        try:
+            callback(ok, msg)
+        except RuntimeError:
+            # The requesting dialog/row was closed meanwhile.
+            pass
 
+    def closeEvent(self, event):
+        self._closing = True
         try:
-            val = self.client.get(qp, as_string=True)
-            if query_value_indicates_error(val):
-                short = summarize_error_text(val, self.error_name_by_code)
-                msg = f'QRY ERROR <- {qp}: {short}'
-                self._log(msg)
-                self._set_readback_field(short)
-                return False, msg
-            msg = compact_query_message_value(f'QRY <- {qp}: {val}')
-            self._log(msg)
-            self._set_readback_field(val)
-            return True, msg
-        except Exception as ex:
-            msg = f'ERROR query read: {ex}'
-            self._log(msg)
-            self._set_readback_field(msg)
-            return False, msg
+            # A queued put+get pair may still be running; give it its timeouts.
+            self._cmd_io_thread.quit()
+            self._cmd_io_thread.wait(int(float(self.client.timeout) * 2000) + 500)
+            # A slow parse or cache write must not keep the window open; a
+            # late result is dropped by _on_catalog_loaded.
+            self._catalog_thread.quit()
+            self._catalog_thread.wait(2000)
+        except Exception:
+            pass
+        super().closeEvent(event)
 
     def send_command(self):
-        self.read_raw_command(self.command_edit.text())
+        # The result is logged and shown in the readback field by the handlers.
+        self.read_raw_command_async(self.command_edit.text(), lambda _ok, _msg: None)
+
+    def _show_query_value(self, qp, val):
+        if isinstance(val, Exception):
+            self._set_readback_field(f'ERROR query read: {val}')
+            self._log(f'ERROR query read: {val}')
+            return
+        self._set_readback_field(val)
+        self._log(compact_query_message_value(f'QRY <- {qp}: {val}'))
 
     def proc_and_read_query(self):
         qp = self.qry_pv.text().strip()
         if not qp:
             self._log('ERROR: Query PV is empty')
             return
-        try:
-            proc_pv = _proc_pv_for_readback(qp)
-            self.client.put(proc_pv, 1, wait=True)
-            val = self.client.get(qp, as_string=True)
-            self._set_readback_field(val)
-            self._log(compact_query_message_value(f'QRY <- {qp}: {val}'))
-        except Exception as ex:
-            self._set_readback_field(f'ERROR query read: {ex}')
-            self._log(f'ERROR query read: {ex}')
+        self._read_query_async(_proc_pv_for_readback(qp), qp)
 
     def read_query_only(self):
         qp = self.qry_pv.text().strip()
         if not qp:
             self._log('ERROR: Query PV is empty')
             return
-        try:
-            val = self.client.get(qp, as_string=True)
-            self._set_readback_field(val)
-            self._log(compact_query_message_value(f'QRY <- {qp}: {val}'))
-        except Exception as ex:
-            self._set_readback_field(f'ERROR query read: {ex}')
-            self._log(f'ERROR query read: {ex}')
+        self._read_query_async('', qp)
 
 
 def main():
@@ -1659,6 +2551,7 @@ def main():
     ap.add_argument('--qry-pv', default='', help='Query PV name/readback PV (overrides --prefix)')
     ap.add_argument('--timeout', type=float, default=2.0, help='EPICS timeout in seconds')
     ap.add_argument('--error-db', default='', help='Path to local error DB JSON (default: ecmc_error_codes.json)')
+    ap.add_argument('--no-cache', action='store_true', help='Always re-read the catalog instead of using the prepared cache')
     args = ap.parse_args()
 
     default_cmd_pv = args.cmd_pv.strip() if args.cmd_pv else _join_prefix_pv(args.prefix, 'MCU-Cmd.AOUT')
@@ -1676,6 +2569,7 @@ def main():
         default_qry_pv=default_qry_pv,
         timeout=args.timeout,
         error_db_path=args.error_db,
+        use_cache=not args.no_cache,
     )
     w.show()
     sys.exit(app.exec_())
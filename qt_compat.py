@@ -6,13 +6,11 @@ QT_BINDING = ""
 
 try:
     from PyQt5 import QtCore, QtGui, QtWidgets
-    from PyQt5.QtSvg import QSvgWidget
 
     QT_BINDING = "PyQt5"
 except Exception as pyqt_error:
     try:
         from PySide6 import QtCore, QtGui, QtWidgets  # type: ignore
-        from PySide6.QtSvgWidgets import QSvgWidget  # type: ignore
 
         QT_BINDING = "PySide6"
     except Exception as pyside_error:
@@ -22,3 +20,16 @@ except Exception as pyqt_error:
             "Install PyQt5 or PySide6, or launch the app with a Python environment "
             "that already provides one."
         ) from pyside_error
+
+
+def __getattr__(name):
+    # QtSvg is only needed by the ISO230 app; load it on first use so the other
+    # apps do not pay for importing it at startup.
+    if name != "QSvgWidget":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if QT_BINDING == "PyQt5":
+        from PyQt5.QtSvg import QSvgWidget
+    else:
+        from PySide6.QtSvgWidgets import QSvgWidget  # type: ignore
+    globals()["QSvgWidget"] = QSvgWidget
+    return QSvgWidget